@@ -0,0 +1,160 @@
+import os
+import json
+import sqlite3
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+###########################################################
+###########ALMACÉN DE RESULTADOS (SQLITE)##################
+###########################################################
+
+# Un único archivo, solo se agregan filas: cada ejecución queda registrada
+DEFAULT_DB = "resultados.sqlite"
+
+STAT_FIELDS = ["min", "median", "p95", "mean", "stddev", "repetitions", "loops"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at TEXT NOT NULL,
+    suite TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    size TEXT NOT NULL,
+    min REAL, median REAL, p95 REAL, mean REAL, stddev REAL,
+    repetitions INTEGER, loops INTEGER,
+    machine TEXT,
+    git_revision TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_lookup ON runs (suite, algorithm, data_type, size);
+CREATE INDEX IF NOT EXISTS runs_revision ON runs (git_revision);
+"""
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")  # Permite leer mientras otro proceso agrega filas
+    conn.executescript(_SCHEMA)
+    return conn
+
+_machine_info = None
+_git_revision = None
+
+# Funciones para identificar la máquina y la versión del código
+def machine_info():
+    """Datos de la máquina donde se midió (se calcula una vez por proceso)."""
+    global _machine_info
+    if _machine_info is None:
+        import numpy as np
+        _machine_info = {
+            "node": platform.node(),
+            "system": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+        }
+    return _machine_info
+
+def git_revision():
+    """Revisión de git del código medido; termina en `-dirty` si hay cambios sin commitear."""
+    global _git_revision
+    if _git_revision is None:
+        folder = os.path.dirname(os.path.abspath(__file__))
+        try:
+            rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=folder,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+            dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=folder,
+                                   capture_output=True, text=True, check=True).stdout.strip()
+            _git_revision = rev + ("-dirty" if dirty else "")
+        except (OSError, subprocess.CalledProcessError):
+            _git_revision = "desconocida"
+    return _git_revision
+
+# Función para guardar registros de tiempo
+def record_results(records, suite, db_path=DEFAULT_DB):
+    """Agrega `records` (dicts con algorithm, data_type, size y las estadísticas de tiempo) al almacén.
+
+    Las claves que no son columnas se guardan como JSON en `extra`.
+    """
+    known = {"algorithm", "data_type", "size", "time", *STAT_FIELDS}
+    recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    machine = json.dumps(machine_info(), sort_keys=True)
+    revision = git_revision()
+
+    rows = []
+    for r in records:
+        extra = {k: v for k, v in r.items() if k not in known}
+        rows.append((recorded_at, suite, r["algorithm"], r["data_type"], str(r["size"]),
+                     *(r.get(field) for field in STAT_FIELDS),
+                     machine, revision, json.dumps(extra, sort_keys=True, default=str) if extra else None))
+
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO runs (recorded_at, suite, algorithm, data_type, size, "
+                "min, median, p95, mean, stddev, repetitions, loops, machine, git_revision, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    finally:
+        conn.close()
+
+# Funciones para consultar el almacén
+def load_results(db_path=DEFAULT_DB, suite=None, algorithm=None, data_type=None, size=None,
+                 revision=None, latest_only=False):
+    """Retorna los registros que cumplen los filtros como lista de dicts.
+
+    Con `latest_only` se entrega solo la ejecución más reciente de cada (suite, algoritmo, dataset, tamaño).
+    """
+    filters, params = [], []
+    for column, value in (("suite", suite), ("algorithm", algorithm), ("data_type", data_type),
+                          ("size", None if size is None else str(size)), ("git_revision", revision)):
+        if value is not None:
+            filters.append(f"{column} = ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(filters)}" if filters else ""
+    query = f"SELECT * FROM runs {where}"
+    if latest_only:
+        query = (f"SELECT * FROM runs WHERE id IN (SELECT MAX(id) FROM runs {where} "
+                 f"GROUP BY suite, algorithm, data_type, size)")
+    query += " ORDER BY id"
+
+    if not os.path.exists(db_path):
+        return []
+    conn = _connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+
+    records = []
+    for row in rows:
+        record = dict(row)
+        record["machine"] = json.loads(record["machine"]) if record["machine"] else None
+        record["extra"] = json.loads(record["extra"]) if record["extra"] else {}
+        record["time"] = record["median"]
+        records.append(record)
+    return records
+
+def load_results_dataframe(db_path=DEFAULT_DB, **filters):
+    """Igual que load_results pero como DataFrame de pandas."""
+    import pandas as pd
+    return pd.DataFrame(load_results(db_path, **filters))
+
+def compare_revisions(old_revision, new_revision, db_path=DEFAULT_DB, suite=None):
+    """Compara la mediana de cada caso entre dos revisiones (la ejecución más reciente de cada una).
+
+    Retorna dicts con los tiempos y `ratio` = nuevo / anterior (> 1 es más lento).
+    """
+    old = {(r["suite"], r["algorithm"], r["data_type"], r["size"]): r
+           for r in load_results(db_path, suite=suite, revision=old_revision, latest_only=True)}
+    comparison = []
+    for r in load_results(db_path, suite=suite, revision=new_revision, latest_only=True):
+        key = (r["suite"], r["algorithm"], r["data_type"], r["size"])
+        if key in old and old[key]["median"]:
+            comparison.append({"suite": key[0], "algorithm": key[1], "data_type": key[2], "size": key[3],
+                               "old": old[key]["median"], "new": r["median"],
+                               "ratio": r["median"] / old[key]["median"]})
+    return comparison
@@ -1,8 +1,21 @@
 import numpy as np
 import os
-import time
+import copy
+import bisect
+import math
+import logging
+import argparse
+import functools
+
+from AlmacenResultados import record_results
+from CacheResultados import DEFAULT_CACHE, cache_key, code_fingerprint, dataset_hash, lookup, store, verify_sorted
+from EscrituraResultados import ResultWriter, result_checksum, result_path, write_result, write_text_streaming
+from FormatoBinario import dataset_kind, list_datasets, load_typed_array
+from MedicionTiempo import benchmark, format_stats
 
 # Algoritmos de ordenamiento
+# Los algoritmos in-place reciben una lista o un buffer tipado (array.array o memoryview de un
+# np.ndarray); sort_array entrega a cada uno el memoryview del arreglo NumPy sin convertirlo a lista
 
 def bubble_sort(arr):
     n = len(arr)
@@ -14,8 +27,9 @@ def bubble_sort(arr):
 def merge_sort(arr):
     if len(arr) > 1:
         mid = len(arr) // 2
-        L = arr[:mid]
-        R = arr[mid:]
+        # El slice de un memoryview es una vista: las mitades se copian a listas
+        L = arr[:mid] if isinstance(arr, list) else arr[:mid].tolist()
+        R = arr[mid:] if isinstance(arr, list) else arr[mid:].tolist()
 
         merge_sort(L)
         merge_sort(R)
@@ -40,6 +54,148 @@ def merge_sort(arr):
             j += 1
             k += 1
 
+# Merge sort natural (adaptativo): detecta corridas ya ordenadas y las mezcla con galope
+def adaptive_merge_sort(arr, min_run=32, min_gallop=7):
+    """Merge sort natural in-place que aprovecha corridas ascendentes/descendentes con un único buffer auxiliar."""
+    n = len(arr)
+    if n < 2:
+        return
+
+    # Detectar corridas y extender las cortas hasta `min_run` con inserción binaria
+    bounds = [0]
+    start = 0
+    while start < n:
+        end = _find_run(arr, start, n)
+        if end - start < min_run:
+            forced_end = min(start + min_run, n)
+            _binary_insertion_sort(arr, start, end, forced_end)
+            end = forced_end
+        bounds.append(end)
+        start = end
+
+    if len(bounds) == 2:
+        return  # Todo el arreglo es una sola corrida
+
+    # Mezclas de abajo hacia arriba alternando entre el arreglo y un buffer preasignado
+    src, dst = arr, _copy_buffer(arr)
+    while len(bounds) > 2:
+        merged = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo = bounds[r]
+            if r + 2 < len(bounds):
+                mid, hi = bounds[r + 1], bounds[r + 2]
+                _merge_runs(src, dst, lo, mid, hi, min_gallop)
+            else:
+                hi = bounds[r + 1]
+                dst[lo:hi] = src[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+
+    if src is not arr:
+        arr[:] = src
+
+# Funciones auxiliares para el merge sort adaptativo
+def _copy_buffer(arr):
+    """Copia con el mismo tipo de elemento que `arr` (el slice de un memoryview no copia)."""
+    if isinstance(arr, memoryview):
+        return memoryview(np.array(arr))
+    return arr[:]
+
+def _find_run(arr, start, n):
+    """Retorna el fin de la corrida que empieza en `start`, invirtiendo las descendentes."""
+    end = start + 1
+    if end == n:
+        return end
+    if arr[end] < arr[start]:
+        # Corrida no creciente: se invierte y luego se restaura el orden de los iguales (estable)
+        while end + 1 < n and arr[end + 1] <= arr[end]:
+            end += 1
+        end += 1
+        _reverse_range(arr, start, end)
+        i = start
+        while i < end:
+            j = i + 1
+            while j < end and arr[j] == arr[i]:
+                j += 1
+            if j - i > 1:
+                _reverse_range(arr, i, j)
+            i = j
+    else:
+        while end + 1 < n and arr[end + 1] >= arr[end]:
+            end += 1
+        end += 1
+    return end
+
+def _reverse_range(arr, lo, hi):
+    hi -= 1
+    while lo < hi:
+        arr[lo], arr[hi] = arr[hi], arr[lo]
+        lo += 1
+        hi -= 1
+
+def _binary_insertion_sort(arr, lo, sorted_end, hi):
+    """Inserta arr[sorted_end:hi] en el prefijo ya ordenado arr[lo:sorted_end]."""
+    for i in range(sorted_end, hi):
+        x = arr[i]
+        pos = bisect.bisect_right(arr, x, lo, i)
+        j = i
+        while j > pos:
+            arr[j] = arr[j - 1]
+            j -= 1
+        arr[pos] = x
+
+def _gallop(src, key, lo, hi, strict):
+    """Búsqueda exponencial + binaria: primer índice en [lo, hi) con src[idx] > key (o >= key si `strict`)."""
+    search = bisect.bisect_left if strict else bisect.bisect_right
+    step = 1
+    prev = lo
+    probe = lo
+    while probe < hi and (src[probe] < key if strict else src[probe] <= key):
+        prev = probe + 1
+        probe = lo + step
+        step <<= 1
+    return search(src, key, prev, min(probe, hi))
+
+def _merge_runs(src, dst, lo, mid, hi, min_gallop):
+    """Mezcla src[lo:mid] y src[mid:hi] en dst[lo:hi], galopando cuando una corrida gana seguido."""
+    if src[mid - 1] <= src[mid]:
+        dst[lo:hi] = src[lo:hi]  # Las corridas ya están en orden
+        return
+
+    i, j, k = lo, mid, lo
+    wins_left = wins_right = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            wins_right += 1
+            wins_left = 0
+            if wins_right >= min_gallop:
+                end = _gallop(src, src[i], j, hi, strict=True)
+                dst[k:k + end - j] = src[j:end]
+                k += end - j
+                j = end
+                wins_right = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            wins_left += 1
+            wins_right = 0
+            if wins_left >= min_gallop and j < hi:
+                end = _gallop(src, src[j], i, mid, strict=False)
+                dst[k:k + end - i] = src[i:end]
+                k += end - i
+                i = end
+                wins_left = 0
+
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    elif j < hi:
+        dst[k:hi] = src[j:hi]
+
 def quick_sort(arr):
     if len(arr) <= 1:
         return arr
@@ -49,68 +205,352 @@ def quick_sort(arr):
     right = [x for x in arr if x > pivot]
     return quick_sort(left) + middle + quick_sort(right)
 
+# Introsort in-place: quicksort de tres vías con respaldo a heapsort
+def intro_sort(arr, small_size=16):
+    """Quicksort in-place con pivote mediana de tres/ninther, partición de Dijkstra,
+    inserción para particiones pequeñas y heapsort si la profundidad supera 2·log n."""
+    n = len(arr)
+    if n < 2:
+        return
+    _intro_sort(arr, 0, n - 1, 2 * int(math.log2(n)), small_size)
+
+# Funciones auxiliares para el introsort
+def _intro_sort(arr, lo, hi, depth_limit, small_size):
+    while hi - lo + 1 > small_size:
+        if depth_limit == 0:
+            _heap_sort(arr, lo, hi)
+            return
+        depth_limit -= 1
+
+        pivot = arr[_choose_pivot(arr, lo, hi)]
+        lt, gt = _three_way_partition(arr, lo, hi, pivot)
+
+        # Recursión sobre la parte más pequeña y ciclo sobre la más grande (pila O(log n))
+        if lt - lo < hi - gt:
+            _intro_sort(arr, lo, lt - 1, depth_limit, small_size)
+            lo = gt + 1
+        else:
+            _intro_sort(arr, gt + 1, hi, depth_limit, small_size)
+            hi = lt - 1
+    _insertion_sort(arr, lo, hi)
+
+def _median_of_three(arr, a, b, c):
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+def _choose_pivot(arr, lo, hi):
+    """Mediana de tres para rangos medianos y ninther (mediana de medianas) para rangos grandes."""
+    mid = (lo + hi) // 2
+    if hi - lo < 40:
+        return _median_of_three(arr, lo, mid, hi)
+    step = (hi - lo) // 8
+    return _median_of_three(
+        arr,
+        _median_of_three(arr, lo, lo + step, lo + 2 * step),
+        _median_of_three(arr, mid - step, mid, mid + step),
+        _median_of_three(arr, hi - 2 * step, hi - step, hi),
+    )
+
+def _three_way_partition(arr, lo, hi, pivot):
+    """Partición de la bandera holandesa: deja arr[lt:gt+1] == pivot."""
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        x = arr[i]
+        if x < pivot:
+            arr[lt], arr[i] = x, arr[lt]
+            lt += 1
+            i += 1
+        elif x > pivot:
+            arr[gt], arr[i] = x, arr[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def _insertion_sort(arr, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        x = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > x:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+
+def _heap_sort(arr, lo, hi):
+    n = hi - lo + 1
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+def _sift_down(arr, lo, root, size):
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if arr[lo + root] < arr[lo + child]:
+            arr[lo + root], arr[lo + child] = arr[lo + child], arr[lo + root]
+            root = child
+        else:
+            return
+
+# Inserción directa (el despachador automático la usa para arreglos pequeños)
+def insertion_sort(arr):
+    _insertion_sort(arr, 0, len(arr) - 1)
+
+# Selección automática: muestrea el arreglo y aplica el algoritmo más conveniente
+def auto_sort(arr):
+    """Elige entre inserción, merge adaptativo, conteo e introsort según el tamaño, la presortedness
+    y el rango de claves (ver SeleccionAlgoritmo) y retorna el arreglo ordenado."""
+    from SeleccionAlgoritmo import choose_algorithm
+    return sort_array(choose_algorithm(arr), arr)
+
 def sort_with_builtin(arr):
     return sorted(arr)
 
-# Función para medir el tiempo de los algoritmos
-def measure_sorting_time(algorithm, arr):
-    start_time = time.time()
+# Ordenamiento por conteo / radix LSD para claves enteras acotadas
+def counting_sort(arr, max_range=1 << 20):
+    """Ordena enteros en O(n + k) con conteo si el rango k es acotado; si no, usa radix LSD vectorizado."""
+    if len(arr) <= 1:
+        return arr
+    keys = np.asarray(arr, dtype=np.int64)
+    min_val = int(keys.min())
+    span = int(keys.max()) - min_val + 1
+
+    if span <= max_range:
+        # Rango pequeño: contar cada clave y expandir los conteos en orden
+        counts = np.bincount(keys - min_val, minlength=span)
+        result = np.repeat(np.arange(min_val, min_val + span, dtype=np.int64), counts)
+    else:
+        # Rango grande: desplazar a no negativos (sin desbordar) y aplicar radix LSD
+        offsets = (keys - np.int64(min_val)).view(np.uint64)
+        result = (radix_sort(offsets, span - 1) + np.uint64(min_val % (1 << 64))).view(np.int64)
+
+    return result.tolist() if isinstance(arr, list) else result
+
+# Líneas base de NumPy (np.sort con cada `kind`)
+NUMPY_SORT_KINDS = {"numpy_quicksort": "quicksort", "numpy_mergesort": "mergesort", "numpy_stable": "stable"}
+
+def numpy_sort(arr, kind="quicksort"):
+    """Ordena un np.ndarray in-place con ndarray.sort; otras secuencias se convierten a un arreglo nuevo."""
+    if isinstance(arr, np.ndarray):
+        arr.sort(kind=kind)
+        return arr
+    return np.sort(np.asarray(arr), kind=kind)
+
+def radix_sort(keys, max_key, digit_bits=16):
+    """Radix LSD sobre claves enteras no negativas, procesando `digit_bits` bits por pasada."""
+    mask = np.uint64((1 << digit_bits) - 1)
+    shift = 0
+    while shift == 0 or (max_key >> shift) > 0:
+        digits = ((keys >> np.uint64(shift)) & mask).astype(np.uint16 if digit_bits <= 16 else np.uint32)
+        # argsort estable sobre dígitos de 16 bits usa radix internamente en NumPy
+        keys = keys[np.argsort(digits, kind='stable')]
+        shift += digit_bits
+    return keys
+
+# Función para aplicar un algoritmo por nombre (retorna el arreglo ordenado)
+def sort_array(algorithm, arr):
+    """`arr` puede ser una lista, un array.array o un np.ndarray 1-D; los algoritmos in-place
+    ordenan un np.ndarray directamente en su buffer (memoryview) y retornan el mismo arreglo."""
+    buffer = memoryview(arr) if isinstance(arr, np.ndarray) else arr
     if algorithm == "bubble_sort":
-        bubble_sort(arr)
+        bubble_sort(buffer)
     elif algorithm == "merge_sort":
-        merge_sort(arr)
+        merge_sort(buffer)
+    elif algorithm == "adaptive_merge_sort":
+        adaptive_merge_sort(buffer)
     elif algorithm == "quick_sort":
-        arr = quick_sort(arr)
+        arr = quick_sort(buffer)
+    elif algorithm == "intro_sort":
+        intro_sort(buffer)
     elif algorithm == "sorted_builtin":
-        arr = sort_with_builtin(arr)
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    return arr, elapsed_time
+        arr = sort_with_builtin(buffer)
+    elif algorithm == "counting_sort":
+        arr = counting_sort(arr)
+    elif algorithm == "insertion_sort":
+        insertion_sort(buffer)
+    elif algorithm == "auto_sort":
+        arr = auto_sort(arr)
+    elif algorithm in NUMPY_SORT_KINDS:
+        arr = numpy_sort(arr, NUMPY_SORT_KINDS[algorithm])
+    else:
+        raise ValueError(f"Algoritmo de ordenamiento desconocido: {algorithm}")
+    return arr
+
+# Función para medir el tiempo de los algoritmos
+def measure_sorting_time(algorithm, arr, workers=1, instrument=False, **timing_options):
+    """Ordena copias de `arr` (que no se modifica) y retorna (arreglo ordenado, estadísticas de tiempo).
+
+    Con un np.ndarray cada repetición copia solo el buffer tipado (n bytes para int8), no una lista de objetos.
+    Con `workers` > 1 se usa el ordenamiento paralelo multivía (ver OrdenamientoParalelo), donde
+    `algorithm` ordena cada bloque.
+    Con auto_sort (y `workers` = 1) `dispatch` trae el algoritmo elegido, el motivo y las
+    características muestreadas (ver SeleccionAlgoritmo.dispatch_decision); también va al log en nivel INFO.
+    Con `instrument` (y si el algoritmo está en INSTRUMENTED_SORTS) se agrega `operations` a las
+    estadísticas: los contadores de Instrumentacion, medidos en una ejecución aparte.
+
+    `timing_options` se pasan a MedicionTiempo.benchmark (repetitions, warmup, disable_gc, ...).
+    """
+    if workers > 1:
+        from OrdenamientoParalelo import ParallelSorter
+        with ParallelSorter(arr, algorithm, workers) as sorter:
+            result, stats = benchmark(sorter.sort, **timing_options)
+    else:
+        result, stats = benchmark(lambda data: sort_array(algorithm, data), setup=lambda: (copy.copy(arr),),
+                                  **timing_options)
+        if algorithm == "auto_sort":
+            # La decisión es determinista: se repite fuera de la medición para registrarla junto al tiempo
+            from SeleccionAlgoritmo import dispatch_decision, log_decision
+            stats["dispatch"] = dispatch_decision(arr)
+            log_decision(stats["dispatch"])
+
+    if instrument:
+        from Instrumentacion import INSTRUMENTED_SORTS, count_sorting_operations
+        if algorithm in INSTRUMENTED_SORTS:
+            stats["operations"] = count_sorting_operations(algorithm, arr)
+    return result, stats
 
 # Función para guardar el arreglo ordenado
 def save_sorted_array(arr, filename):
     # Asegurarse de que el directorio exista antes de guardar el archivo
-    folder = os.path.dirname(filename)
-    if not os.path.exists(folder):
-        os.makedirs(folder)
-    with open(filename, 'w') as f:
-        f.write(' '.join(map(str, arr)) + '\n')
+    # Se escribe por bloques en vez de armar un único string con todo el arreglo
+    write_text_streaming(arr, filename)
 
 # Función para guardar el tiempo de análisis
-def save_sorting_time(algorithm_name, size, elapsed_time,filename):
+def save_sorting_time(algorithm_name, size, elapsed_time, filename, stats=None):
     folder_name = f"Result_of_{algorithm_name}"
-    if not os.path.exists(folder_name):
-        os.makedirs(folder_name)
+    os.makedirs(folder_name, exist_ok=True)
     time_file = os.path.join(folder_name, f"Resultado_{filename}AnalisisTiempo_{size}.txt")
     with open(time_file, 'w') as f:
         f.write(f"Tiempo para ordenar el archivo de tamaño {size}: {elapsed_time} segundos\n")
+        if stats:
+            f.write(format_stats(stats) + "\n")
+
+# Algoritmos que se aplican a cada dataset
+SORTING_ALGORITHMS = ["bubble_sort", "merge_sort", "adaptive_merge_sort", "quick_sort", "intro_sort", "sorted_builtin", "counting_sort",
+                      "numpy_quicksort", "numpy_mergesort", "numpy_stable", "auto_sort"]
+
+# Función de cada algoritmo (su código forma parte de la clave del caché de resultados)
+SORTING_FUNCTIONS = {
+    "bubble_sort": bubble_sort,
+    "merge_sort": merge_sort,
+    "adaptive_merge_sort": adaptive_merge_sort,
+    "quick_sort": quick_sort,
+    "intro_sort": intro_sort,
+    "sorted_builtin": sort_with_builtin,
+    "counting_sort": counting_sort,
+    "numpy_quicksort": numpy_sort,
+    "numpy_mergesort": numpy_sort,
+    "numpy_stable": numpy_sort,
+    "insertion_sort": insertion_sort,
+    "auto_sort": auto_sort,
+}
+
+def algorithm_params(algorithm):
+    """Parámetros que cambian el comportamiento del algoritmo sin estar en su código (para el caché)."""
+    if algorithm == "auto_sort":
+        from SeleccionAlgoritmo import dispatch_decision, load_thresholds
+        return {"thresholds": load_thresholds(), "selector": code_fingerprint(dispatch_decision)}
+    return {}
+
+# Función para aplicar un algoritmo a un dataset y guardar sus resultados
+def run_sorting_job(file_path, algorithm, data=None, writer=None, output_mode="text",
+                    cache=None, force=False, load_data=None, **timing_options):
+    """Ordena el dataset `file_path` con `algorithm`, guarda el arreglo ordenado y retorna el registro de tiempo.
+
+    Si se pasa `writer` (EscrituraResultados.ResultWriter) el guardado lo hace el escritor (en segundo
+    plano solo en los modos "binary" y "checksum"); si no, se escribe aquí mismo en el modo
+    `output_mode` ("text", "binary" o "checksum").
+    Con `cache` (ruta de CacheResultados) no se vuelve a medir si el dataset, el código del
+    algoritmo y las opciones no cambiaron y el resultado sigue guardado; `force` ignora el caché.
+    El registro de una celda tomada del caché trae `cached` = True.
+    Sin `data`, el dataset se carga con `load_data()` (si se pasa) o con load_typed_array, y solo
+    cuando hay que medir; así un barrido puede compartir una carga por archivo entre algoritmos.
+    """
+    filename = os.path.basename(file_path)
+    # Extraer el tamaño del archivo del nombre
+    size = filename.split('_')[-1].replace('.txt', '')
+    record = {"algorithm": algorithm, "data_type": dataset_kind(filename), "size": int(size)}
+    result_file = f"Result_of_{algorithm}/{filename}"
+    output_mode = writer.mode if writer is not None else output_mode
+
+    if cache:
+        key = cache_key("sort", algorithm, [dataset_hash(file_path, cache)],
+                        code_fingerprint(SORTING_FUNCTIONS[algorithm]),
+                        {"buffer": "list" if isinstance(data, list) else "typed", **algorithm_params(algorithm),
+                         **timing_options})
+        entry = None if force else lookup(key, cache)
+        if entry is not None and os.path.exists(result_path(result_file, output_mode)):
+            return {**record, "time": entry["stats"]["median"], **entry["stats"], "cached": True}
+
+    if data is None:
+        # Buffer tipado (int8 para valores entre 0 y 100) en vez de una lista de enteros de Python
+        data = load_data() if load_data is not None else load_typed_array(file_path)
+
+    sorted_arr, stats = measure_sorting_time(algorithm, data, **timing_options)
+    elapsed_time = stats["median"]
+
+    # Solo se guardan en el caché resultados verificados
+    if cache:
+        if verify_sorted(data, sorted_arr):
+            checksum, shape = result_checksum(sorted_arr)
+            store(key, "sort", algorithm, file_path, checksum, shape, stats, cache)
+        else:
+            print(f"{algorithm} no ordenó correctamente {file_path}; el resultado no se guarda en el caché.")
+
+    # Guardar el arreglo ordenado
+    if writer is not None:
+        writer.submit(sorted_arr, result_file)
+    else:
+        write_result(sorted_arr, result_file, output_mode)
+
+    return {**record, "time": elapsed_time, **stats}
 
 # Función para procesar todos los archivos y aplicar los algoritmos
-def process_datasets():
+def process_datasets(output_mode="text", cache=DEFAULT_CACHE, force=False, instrument=False, algorithms=None):
+    """Aplica cada algoritmo (por defecto, SORTING_ALGORITHMS) a cada dataset; las celdas sin cambios
+    se toman del caché (`cache`=None lo desactiva)."""
     dataset_folder = "datasets_a"
-    algorithms = ["bubble_sort", "merge_sort", "quick_sort", "sorted_builtin"]
+    algorithms = algorithms or SORTING_ALGORITHMS
 
-    # Para cada archivo en la carpeta datasets
-    for filename in os.listdir(dataset_folder):
-        file_path = os.path.join(dataset_folder, filename)
-        with open(file_path, 'r') as file:
-            data = list(map(int, file.readline().split()))
+    # En los modos binary y checksum los arreglos ordenados se guardan en un hilo aparte mientras corre
+    # el siguiente algoritmo; el modo text se escribe en el mismo hilo, entre mediciones
+    with ResultWriter(output_mode) as writer:
+        # Para cada archivo en la carpeta datasets
+        for filename in list_datasets(dataset_folder):
+            file_path = os.path.join(dataset_folder, filename)
+            # El dataset se lee una sola vez, con la primera celda que se recalcula
+            load_data = functools.lru_cache(maxsize=None)(functools.partial(load_typed_array, file_path))
 
-        # Extraer el tamaño del archivo del nombre
-        size = filename.split('_')[-1].replace('.txt', '')
+            # Aplicar cada algoritmo de ordenamiento (el dataset se lee solo si alguna celda se recalcula)
+            records = [run_sorting_job(file_path, algorithm, None, writer, cache=cache, force=force,
+                                       load_data=load_data, instrument=instrument)
+                       for algorithm in algorithms]
 
-        # Aplicar cada algoritmo de ordenamiento
-        for algorithm in algorithms:
-            arr_copy = data.copy()
-            sorted_arr, elapsed_time = measure_sorting_time(algorithm, arr_copy)
-            
-            # Guardar el arreglo ordenado
-            result_file = f"Result_of_{algorithm}/{filename}"
-            save_sorted_array(sorted_arr, result_file)
-
-            # Guardar el tiempo de ejecución
-            save_sorting_time(algorithm, size, elapsed_time,filename)
+            # Guardar los tiempos nuevos en el almacén de resultados (uno por dataset, por si el barrido se interrumpe)
+            measured = [r for r in records if not r.get("cached")]
+            if measured:
+                record_results(measured, "sort")
 
 # Ejecutar el proceso
-process_datasets()
-print("Resultados Generados! :D")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ordena cada dataset de datasets_a con cada algoritmo.")
+    parser.add_argument("--force", "--forzar", action="store_true", help="recalcular aunque el resultado esté en el caché")
+    parser.add_argument("--sin-cache", action="store_true", help="no leer ni escribir el caché de resultados")
+    parser.add_argument("--salida", choices=["text", "binary", "checksum"], default="text")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="agregar contadores de operaciones a cada registro (ver Instrumentacion)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")  # Decisiones de auto_sort
+    process_datasets(args.salida, None if args.sin_cache else DEFAULT_CACHE, args.force, args.instrumentar)
+    print("Resultados Generados! :D")
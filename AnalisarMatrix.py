@@ -1,45 +1,53 @@
 import numpy as np
 import os
-import time
-import math
+import argparse
+
+from AlmacenResultados import record_results
+from CacheResultados import DEFAULT_CACHE, cache_key, code_fingerprint, dataset_hash, lookup, store, verify_product
+from EscrituraResultados import ResultWriter, result_checksum, result_path, write_result, write_text_streaming
+from FormatoBinario import dataset_exists, dataset_kind, list_datasets, load_matrix
+from MedicionTiempo import benchmark, format_stats
 
 # Algoritmo cúbico tradicional para la multiplicación de matrices
 def traditional_multiplication(A, B):
-    """Algoritmo iterativo cúbico tradicional para multiplicación de matrices."""
-    n = len(A)
-    C = [[0] * n for _ in range(n)]
-    for i in range(n):
+    """Algoritmo iterativo cúbico tradicional para multiplicación de matrices (m×p · p×n)."""
+    m, p, n = len(A), len(B), len(B[0]) if B else 0
+    C = [[0] * n for _ in range(m)]
+    for i in range(m):
         for j in range(n):
-            C[i][j] = sum(A[i][k] * B[k][j] for k in range(n))
+            C[i][j] = sum(A[i][k] * B[k][j] for k in range(p))
     return C
 
 # Algoritmo cúbico optimizado transponiendo la segunda matriz
 def optimized_multiplication(A, B):
     """Algoritmo iterativo cúbico optimizado para la localidad de datos (transponiendo la segunda matriz)."""
-    n = len(A)
+    m, p, n = len(A), len(B), len(B[0]) if B else 0
     B_transpose = list(zip(*B))  # Transponemos la matriz B
-    C = [[0] * n for _ in range(n)]
-    for i in range(n):
+    C = [[0] * n for _ in range(m)]
+    for i in range(m):
         for j in range(n):
-            C[i][j] = sum(A[i][k] * B_transpose[j][k] for k in range(n))
+            C[i][j] = sum(A[i][k] * B_transpose[j][k] for k in range(p))
     return C
 
 # Algoritmo de Strassen para multiplicación de matrices con umbral
 def strassen_multiplication(A, B, threshold=64):
-    """Algoritmo de Strassen con umbral para el tamaño mínimo de recursión."""
-    n = len(A)
+    """Algoritmo de Strassen con umbral para el tamaño mínimo de recursión.
+
+    Acepta A (m×p) y B (p×n); las dimensiones deben ser divisibles por 2 en cada nivel
+    de recursión (ver pad_matrices).
+    """
+    m, p, n = len(A), len(B), len(B[0])
     
     # Si el tamaño de la matriz es menor o igual al umbral, usar el algoritmo cúbico tradicional
-    if n <= threshold:
+    if max(m, p, n) <= threshold:
         return traditional_multiplication(A, B)
     
     # Continuar con Strassen si el tamaño de la matriz es mayor que el umbral
-    if n == 1:
+    if m == p == n == 1:
         return [[A[0][0] * B[0][0]]]
     else:
-        mid = n // 2
-        A11, A12, A21, A22 = partition_matrix(A, mid)
-        B11, B12, B21, B22 = partition_matrix(B, mid)
+        A11, A12, A21, A22 = partition_matrix(A, m // 2, p // 2)
+        B11, B12, B21, B22 = partition_matrix(B, p // 2, n // 2)
 
         M1 = strassen_multiplication(add_matrices(A11, A22), add_matrices(B11, B22), threshold)
         M2 = strassen_multiplication(add_matrices(A21, A22), B11, threshold)
@@ -58,16 +66,17 @@ def strassen_multiplication(A, B, threshold=64):
 
 # Funciones auxiliares para el algoritmo de Strassen
 def add_matrices(A, B):
-    return [[A[i][j] + B[i][j] for j in range(len(A))] for i in range(len(A))]
+    return [[A[i][j] + B[i][j] for j in range(len(A[0]))] for i in range(len(A))]
 
 def subtract_matrices(A, B):
-    return [[A[i][j] - B[i][j] for j in range(len(A))] for i in range(len(A))]
+    return [[A[i][j] - B[i][j] for j in range(len(A[0]))] for i in range(len(A))]
 
-def partition_matrix(A, mid):
-    A11 = [row[:mid] for row in A[:mid]]
-    A12 = [row[mid:] for row in A[:mid]]
-    A21 = [row[:mid] for row in A[mid:]]
-    A22 = [row[mid:] for row in A[mid:]]
+def partition_matrix(A, mid, col_mid=None):
+    col_mid = mid if col_mid is None else col_mid
+    A11 = [row[:col_mid] for row in A[:mid]]
+    A12 = [row[col_mid:] for row in A[:mid]]
+    A21 = [row[:col_mid] for row in A[mid:]]
+    A22 = [row[col_mid:] for row in A[mid:]]
     return A11, A12, A21, A22
 
 def combine_matrices(C11, C12, C21, C22):
@@ -75,65 +84,385 @@ def combine_matrices(C11, C12, C21, C22):
     bottom = [C21[i] + C22[i] for i in range(len(C21))]
     return top + bottom
 
-# Función para medir el tiempo de los algoritmos
-def measure_multiplication_time(algorithm, A, B):
-    A_padded, B_padded = pad_matrices(A, B)  # Asegura que las matrices sean de tamaño potencia de 2
-    start_time = time.time()
+# Strassen vectorizado con NumPy: vistas sin copia, workspace preasignado y hojas con BLAS
+def strassen_numpy(A, B, threshold=None):
+    """Strassen sobre arreglos NumPy A (m×p) y B (p×n); las hojas (tamaño <= `threshold`) usan `@`.
+
+    Si el resultado exacto cabe en la mantisa de float64 se calcula en float64 (BLAS) y se
+    redondea a int64; si cabe en int64, se usa int64 directamente; si no, se delega en
+    exact_multiplication (nunca se retorna un producto desbordado).
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    m, p = A.shape
+    n = B.shape[1]
+    levels = strassen_levels(max(m, p, n), threshold or strassen_threshold())
+    if _product_bound(A, B, p, growth=4 * 4 ** levels) >= 2 ** 63:
+        return exact_multiplication(A, B)
+
+    # Cada dimensión se rellena por separado al múltiplo de 2^niveles (no a la potencia de 2)
+    dtype = _strassen_dtype(A, B, p, levels)
+    A_work = _pad_array(A, levels, dtype)
+    B_work = _pad_array(B, levels, dtype)
+
+    C = np.empty((A_work.shape[0], B_work.shape[1]), dtype=dtype)
+    _strassen_into(A_work, B_work, C, _strassen_workspace(A_work.shape, B_work.shape, levels, dtype), 0)
+    C = C[:m, :n]
+    return np.rint(C).astype(np.int64) if dtype == np.float64 else C
+
+# Funciones auxiliares para el Strassen vectorizado
+def _strassen_dtype(A, B, n, levels):
+    # Cada nivel duplica como máximo los operandos, y cada bloque de C suma hasta 4 productos M
+    # (strassen_numpy ya descartó las cotas >= 2^63, donde int64 desbordaría)
+    return _exact_compute_dtype(A, B, n, growth=4 * 4 ** levels)
+
+_strassen_workspace_cache = {}
+
+def _strassen_workspace(shape_A, shape_B, levels, dtype):
+    """Temporales (TA, TB, M) de cada nivel, reutilizados entre llamadas con las mismas formas."""
+    key = (shape_A, shape_B, levels, np.dtype(dtype).str)
+    if key not in _strassen_workspace_cache:
+        _strassen_workspace_cache.clear()  # Solo se guarda el último workspace para no acumular memoria
+        workspace = []
+        (m, p), n = shape_A, shape_B[1]
+        for _ in range(levels):
+            m, p, n = m // 2, p // 2, n // 2
+            workspace.append((np.empty((m, p), dtype=dtype), np.empty((p, n), dtype=dtype),
+                              np.empty((m, n), dtype=dtype)))
+        _strassen_workspace_cache[key] = workspace
+    return _strassen_workspace_cache[key]
+
+def _strassen_into(A, B, C, workspace, level):
+    """Escribe A @ B en C acumulando M1..M7 directamente sobre las vistas de los cuadrantes de C."""
+    if level == len(workspace):
+        np.matmul(A, B, out=C)
+        return
+
+    hm, hp, hn = A.shape[0] // 2, A.shape[1] // 2, B.shape[1] // 2
+    TA, TB, M = workspace[level]
+    A11, A12, A21, A22 = A[:hm, :hp], A[:hm, hp:], A[hm:, :hp], A[hm:, hp:]
+    B11, B12, B21, B22 = B[:hp, :hn], B[:hp, hn:], B[hp:, :hn], B[hp:, hn:]
+    C11, C12, C21, C22 = C[:hm, :hn], C[:hm, hn:], C[hm:, :hn], C[hm:, hn:]
+
+    # M1 = (A11 + A22)(B11 + B22)
+    np.add(A11, A22, out=TA)
+    np.add(B11, B22, out=TB)
+    _strassen_into(TA, TB, M, workspace, level + 1)
+    C11[...] = M
+    C22[...] = M
+    # M2 = (A21 + A22) B11
+    np.add(A21, A22, out=TA)
+    _strassen_into(TA, B11, M, workspace, level + 1)
+    C21[...] = M
+    C22 -= M
+    # M3 = A11 (B12 - B22)
+    np.subtract(B12, B22, out=TB)
+    _strassen_into(A11, TB, M, workspace, level + 1)
+    C12[...] = M
+    C22 += M
+    # M4 = A22 (B21 - B11)
+    np.subtract(B21, B11, out=TB)
+    _strassen_into(A22, TB, M, workspace, level + 1)
+    C11 += M
+    C21 += M
+    # M5 = (A11 + A12) B22
+    np.add(A11, A12, out=TA)
+    _strassen_into(TA, B22, M, workspace, level + 1)
+    C11 -= M
+    C12 += M
+    # M6 = (A21 - A11)(B11 + B12)
+    np.subtract(A21, A11, out=TA)
+    np.add(B11, B12, out=TB)
+    _strassen_into(TA, TB, M, workspace, level + 1)
+    C22 += M
+    # M7 = (A12 - A22)(B21 + B22)
+    np.subtract(A12, A22, out=TA)
+    np.add(B21, B22, out=TB)
+    _strassen_into(TA, TB, M, workspace, level + 1)
+    C11 += M
+
+_strassen_threshold = None
+
+# Función para elegir automáticamente el tamaño de hoja de strassen_numpy
+def strassen_threshold():
+    """Umbral de cruce calibrado una vez por proceso con tune_strassen_threshold."""
+    global _strassen_threshold
+    if _strassen_threshold is None:
+        _strassen_threshold = tune_strassen_threshold()
+    return _strassen_threshold
+
+def tune_strassen_threshold(candidates=(128, 256, 512, 1024), seed=0):
+    """Retorna el menor tamaño de hoja `s` para el que un nivel de Strassen sobre 2s×2s
+    supera a `@` directo; si nunca gana, retorna el mayor candidato (casi todo va a BLAS)."""
+    rng = np.random.default_rng(seed)
+    for leaf in candidates:
+        X = rng.integers(0, 101, (2 * leaf, 2 * leaf)).astype(np.float64)
+        Y = rng.integers(0, 101, (2 * leaf, 2 * leaf)).astype(np.float64)
+        out = np.empty_like(X)
+        workspace = _strassen_workspace(X.shape, Y.shape, 1, np.float64)
+        _, direct = benchmark(lambda: np.matmul(X, Y, out=out), repetitions=3, min_time=0.005)
+        _, one_level = benchmark(lambda: _strassen_into(X, Y, out, workspace, 0), repetitions=3, min_time=0.005)
+        if one_level["median"] < direct["median"]:
+            return leaf
+    return candidates[-1]
+
+# Función para elegir el tipo de dato con el que un producto NumPy es exacto
+def _exact_compute_dtype(A, B, inner, growth=1):
+    """float64 (BLAS) si |A|·|B|·inner·growth < 2^53, de modo que toda suma parcial es un entero exacto; si no, int64."""
+    return np.float64 if _product_bound(A, B, inner, growth) < 2 ** 53 else np.int64
+
+def _product_bound(A, B, inner, growth=1):
+    """Cota (entero de Python, sin desborde) de cualquier suma parcial de A @ B: max|A|·max|B|·inner·growth."""
+    if A.size == 0 or B.size == 0:
+        return 0
+    return growth * _max_magnitude(A) * _max_magnitude(B) * inner
+
+def _max_magnitude(A):
+    """max|A| como entero de Python; no usa np.abs, que desborda en INT64_MIN (|INT64_MIN| no cabe en int64)."""
+    return max(-int(A.min()), int(A.max()))
+
+# Multiplicación entera exacta con la representación más barata según la cota del resultado
+def exact_multiplication(A, B):
+    """Multiplica matrices enteras A (m×p) y B (p×n) con el mismo resultado que traditional_multiplication.
+
+    Según la cota max|A|·max|B|·p de las entradas de C:
+    - < 2^53: float64 con BLAS (cada suma parcial es un entero exacto) y redondeo a int64.
+    - < 2^63: int64 (sin desborde posible).
+    - mayor: limbs con signo en float64 (ver _limb_multiplication); retorna un arreglo de objetos (int de Python).
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    inner = A.shape[1]
+    bound = _product_bound(A, B, inner)
+    if bound < 2 ** 53:
+        C = np.matmul(A.astype(np.float64), B.astype(np.float64))
+        return np.rint(C).astype(np.int64)
+    if bound < 2 ** 63:
+        return np.matmul(A.astype(np.int64), B.astype(np.int64))
+    return _limb_multiplication(A, B, inner)
+
+def _limb_multiplication(A, B, inner):
+    """A @ B exacto para enteros de cualquier tamaño partiendo cada operando en limbs de `bits` bits.
+
+    Con dígitos balanceados en [-2^(bits-1), 2^(bits-1)) cada producto de limbs cumple
+    2^(2·bits-2)·inner < 2^53, así que sale exacto de BLAS; los productos con el mismo
+    desplazamiento se suman en int64 y se combinan (Horner) con enteros de Python.
+    """
+    bits = max(1, (55 - (inner - 1).bit_length()) // 2)
+    largest = max(_max_magnitude(A), _max_magnitude(B))
+    count = largest.bit_length() // bits + 1
+    A_limbs = _signed_limbs(A, bits, count)
+    B_limbs = _signed_limbs(B, bits, count)
+
+    C = np.zeros((A.shape[0], B.shape[1]), dtype=object)
+    partial_dtype = np.int64 if count < 1 << 10 else object  # Hasta 2^10 sumandos < 2^53 caben en int64
+    for shift in range(2 * count - 2, -1, -1):
+        partial = np.zeros(C.shape, dtype=partial_dtype)
+        for i in range(max(0, shift - count + 1), min(shift, count - 1) + 1):
+            partial += np.rint(np.matmul(A_limbs[i], B_limbs[shift - i])).astype(np.int64)
+        C = C * (1 << bits) + partial.astype(object)
+    return C
+
+def _signed_limbs(A, bits, count):
+    """Descompone A = Σ limb_i · 2^(bits·i) con dígitos balanceados; retorna los limbs en float64."""
+    base, half = 1 << bits, 1 << (bits - 1)
+    rest = A.astype(object)
+    limbs = []
+    for _ in range(count):
+        digit = (rest + half) % base - half
+        limbs.append(digit.astype(np.float64))
+        rest = (rest - digit) // base
+    return limbs
+
+# Multiplicación por bloques (tiling) con kernels NumPy por bloque
+def blocked_multiplication(A, B, block_size=None, panel_size=None):
+    """Multiplica A (m×k) por B (k×n) recorriendo C por bloques de `block_size` (pensado para L1)
+    y la dimensión k por paneles de `panel_size` (pensado para L2); cada bloque usa `@`.
+
+    Si la cota del resultado no cabe en int64 se delega en exact_multiplication.
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    m, k = A.shape
+    n = B.shape[1]
+    if _product_bound(A, B, k) >= 2 ** 63:
+        return exact_multiplication(A, B)
+    bs = block_size or tuned_block_size()
+    panel = panel_size or 4 * bs
+
+    dtype = _exact_compute_dtype(A, B, k)
+    A_work = np.ascontiguousarray(A, dtype=dtype)
+    B_work = np.ascontiguousarray(B, dtype=dtype)
+    C = np.zeros((m, n), dtype=dtype)
+    tile = np.empty((bs, bs), dtype=dtype)
+
+    for p0 in range(0, k, panel):
+        p1 = min(p0 + panel, k)
+        for i0 in range(0, m, bs):
+            i1 = min(i0 + bs, m)
+            for j0 in range(0, n, bs):
+                j1 = min(j0 + bs, n)
+                C_block = C[i0:i1, j0:j1]
+                partial = tile[:i1 - i0, :j1 - j0]
+                for k0 in range(p0, p1, bs):
+                    k1 = min(k0 + bs, p1)
+                    np.matmul(A_work[i0:i1, k0:k1], B_work[k0:k1, j0:j1], out=partial)
+                    C_block += partial
+
+    return np.rint(C).astype(np.int64) if dtype == np.float64 else C
+
+_block_size = None
+
+# Funciones para elegir automáticamente el tamaño de bloque
+def tuned_block_size():
+    """Tamaño de bloque calibrado una vez por proceso con tune_block_size."""
+    global _block_size
+    if _block_size is None:
+        _block_size = tune_block_size()
+    return _block_size
+
+def tune_block_size(candidates=(32, 64, 128, 256, 512), sample_size=512, seed=0):
+    """Mide blocked_multiplication sobre una matriz de prueba con cada candidato y retorna el más rápido."""
+    rng = np.random.default_rng(seed)
+    X = rng.integers(0, 101, (sample_size, sample_size))
+    Y = rng.integers(0, 101, (sample_size, sample_size))
+    timings = {}
+    for bs in candidates:
+        _, stats = benchmark(lambda: blocked_multiplication(X, Y, block_size=bs), repetitions=3, min_time=0.005)
+        timings[bs] = stats["median"]
+    return min(timings, key=timings.get)
+
+# Algoritmos que operan sobre arreglos NumPy en vez de listas de Python
+NUMPY_ALGORITHMS = {"strassen_numpy", "blocked", "exact"}
+# Algoritmos en Python puro que necesitan matrices rellenadas con ceros
+PADDED_ALGORITHMS = {"strassen"}
+# Umbral de la recursión de Strassen en Python puro
+STRASSEN_THRESHOLD = 64
+
+# Función para aplicar un algoritmo por nombre
+def multiply_matrices(algorithm, A, B, **params):
+    """`params` son los de algorithm_params (umbral, tamaño de bloque), resueltos antes de medir."""
     if algorithm == "traditional":
-        C = traditional_multiplication(A_padded, B_padded)
+        return traditional_multiplication(A, B)
     elif algorithm == "optimized":
-        C = optimized_multiplication(A_padded, B_padded)
+        return optimized_multiplication(A, B)
     elif algorithm == "strassen":
-        C = strassen_multiplication(A_padded, B_padded, threshold=64)  # Se añade el umbral
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    return C, elapsed_time
+        return strassen_multiplication(A, B, threshold=params.get("threshold", STRASSEN_THRESHOLD))  # Se añade el umbral
+    elif algorithm == "strassen_numpy":
+        return strassen_numpy(A, B, threshold=params.get("threshold"))
+    elif algorithm == "blocked":
+        return blocked_multiplication(A, B, block_size=params.get("block_size"))
+    elif algorithm == "exact":
+        return exact_multiplication(A, B)
+    raise ValueError(f"Algoritmo de multiplicación desconocido: {algorithm}")
+
+# Función para preparar los operandos según lo que necesita cada algoritmo
+def prepare_operands(algorithm, A, B):
+    """Retorna (A, B, filas, columnas): arreglos para los algoritmos NumPy, listas (rellenadas si
+    el algoritmo lo requiere) para los de Python puro, y la forma real del resultado."""
+    if algorithm in NUMPY_ALGORITHMS:
+        # Los algoritmos vectorizados reciben los arreglos (o memmaps) y rellenan por su cuenta
+        A, B = np.asarray(A), np.asarray(B)
+    else:
+        # Los algoritmos en Python puro trabajan sobre listas; la conversión queda fuera de la medición
+        if isinstance(A, np.ndarray):
+            A = A.tolist()
+        if isinstance(B, np.ndarray):
+            B = B.tolist()
+    rows, cols = len(A), len(B[0])
+    if algorithm in PADDED_ALGORITHMS:
+        A, B = pad_matrices(A, B, threshold=STRASSEN_THRESHOLD)  # Solo Strassen necesita dimensiones divisibles
+    return A, B, rows, cols
 
-# Función para cargar matrices desde archivos de texto
+# Función para medir el tiempo de los algoritmos
+def measure_multiplication_time(algorithm, A, B, workers=1, parallel_mode="bands", instrument=False,
+                                **timing_options):
+    """Retorna (matriz resultante, estadísticas de tiempo); ver MedicionTiempo.benchmark.
+
+    Con `workers` > 1 el algoritmo se ejecuta en paralelo (ver MultiplicacionParalela);
+    `parallel_mode` es "bands" (bandas de filas de C) o "strassen7" (M1..M7 concurrentes).
+    Con `instrument` se agregan los contadores de operaciones (`operations`) como en
+    AnalisarArreglos.measure_sorting_time.
+    """
+    if workers > 1:
+        from MultiplicacionParalela import ParallelMultiplier
+        with ParallelMultiplier(A, B, algorithm, workers, parallel_mode) as multiplier:
+            C, stats = benchmark(multiplier.multiply, **timing_options)
+    else:
+        X, Y, rows, cols = prepare_operands(algorithm, A, B)
+        # Los umbrales calibrados se resuelven aquí: la calibración no debe caer dentro de la medición
+        params = algorithm_params(algorithm)
+        # Las matrices no se modifican, así que todas las repeticiones usan los mismos operandos
+        C, stats = benchmark(lambda X, Y: multiply_matrices(algorithm, X, Y, **params), setup=lambda: (X, Y),
+                             **timing_options)
+        C = crop_matrix(C, rows, cols)
+
+    if instrument:
+        from Instrumentacion import INSTRUMENTED_MULTIPLICATIONS, count_multiplication_operations
+        if algorithm in INSTRUMENTED_MULTIPLICATIONS:
+            X, Y, _, _ = prepare_operands(algorithm, A, B)
+            stats["operations"] = count_multiplication_operations(algorithm, X, Y, STRASSEN_THRESHOLD)
+    return C, stats
+
+# Función para cargar matrices (memmap del binario; el .txt se convierte la primera vez)
 def load_matrix_from_file(filename):
-    return np.loadtxt(filename, dtype=int).tolist()
+    return load_matrix(filename)
 
 # Función para guardar la matriz resultante
 def save_matrix_to_file(matrix, filename):
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    np.savetxt(filename, matrix, fmt='%d', delimiter=' ')
+    # Mismo formato que np.savetxt(fmt='%d'), escrito por bloques de filas
+    write_text_streaming(matrix, filename)
 
 # Función para guardar el tiempo de análisis
 # Función para guardar el tiempo de análisis
-def save_multiplication_time(algorithm_name, size, elapsed_time):
+def save_multiplication_time(algorithm_name, size, elapsed_time, stats=None):
     folder_name = f"Result_of_{algorithm_name}"
     os.makedirs(folder_name, exist_ok=True)
     time_file = os.path.join(folder_name, f"ResultadoAnalisisTiempo_{size}.txt")
     with open(time_file, 'w') as f:
         f.write(f"Tiempo para multiplicar matrices de tamaño {size}: {elapsed_time} segundos\n")
+        if stats:
+            f.write(format_stats(stats) + "\n")
 
-# Función para procesar todos los archivos y aplicar los algoritmos
-def process_matrix_datasets():
-    dataset_folder = "matrix_datasets"
-    algorithms = ["traditional", "optimized", "strassen"]
+# Algoritmos que se aplican a cada par de matrices
+MULTIPLICATION_ALGORITHMS = ["traditional", "optimized", "strassen", "strassen_numpy", "blocked", "exact"]
 
-    for filename in os.listdir(dataset_folder):
-        # Procesar matrices cuadradas
-        if 'square_matrix_1' in filename:
-            file_size = filename.split('_')[-1].replace('.txt', '')
-            file_path_A = os.path.join(dataset_folder, filename)
-            file_path_B = os.path.join(dataset_folder, f'square_matrix_2_{file_size}.txt')
+# Función de cada algoritmo (su código forma parte de la clave del caché de resultados)
+MULTIPLICATION_FUNCTIONS = {
+    "traditional": traditional_multiplication,
+    "optimized": optimized_multiplication,
+    "strassen": strassen_multiplication,
+    "strassen_numpy": strassen_numpy,
+    "blocked": blocked_multiplication,
+    "exact": exact_multiplication,
+}
 
-            A = load_matrix_from_file(file_path_A)
-            B = load_matrix_from_file(file_path_B)
+def algorithm_params(algorithm):
+    """Parámetros con los que corre cada algoritmo (umbral de Strassen, tamaño de bloque calibrado)."""
+    if algorithm == "strassen":
+        return {"threshold": STRASSEN_THRESHOLD}
+    if algorithm == "strassen_numpy":
+        return {"threshold": strassen_threshold()}
+    if algorithm == "blocked":
+        return {"block_size": tuned_block_size()}
+    return {}
 
-            # Aplicar cada algoritmo de multiplicación de matrices
-            for algorithm in algorithms:
-                C, elapsed_time = measure_multiplication_time(algorithm, A, B)
-
-                # Guardar la matriz resultante
-                result_file = f"Result_of_{algorithm}/matrix_result_{file_size}.txt"
-                save_matrix_to_file(C, result_file)
-
-                # Guardar el tiempo de ejecución
-                save_multiplication_time(algorithm, file_size, elapsed_time)
+# Función para encontrar los pares (A, B) de matrices a multiplicar
+def matrix_dataset_pairs(dataset_folder):
+    """Retorna una lista de pares con las rutas de A y B, la etiqueta de tamaño y el nombre del resultado."""
+    pairs = []
+    for filename in list_datasets(dataset_folder):
+        # Matrices cuadradas
+        if 'square_matrix_1' in filename:
+            file_size = filename.split('_')[-1].replace('.txt', '')
+            pairs.append({
+                "path_A": os.path.join(dataset_folder, filename),
+                "path_B": os.path.join(dataset_folder, f'square_matrix_2_{file_size}.txt'),
+                "size": file_size,
+                "result_name": f"matrix_result_{file_size}.txt",
+            })
 
-        # Procesar matrices rectangulares
+        # Matrices rectangulares
         elif 'rectangular_matrix_1' in filename:
             # Extraer el tamaño de la matriz rectangular desde el nombre del archivo
             size_parts = filename.split('_')[-1].replace('.txt', '').split('x')
@@ -141,39 +470,138 @@ def process_matrix_datasets():
             num_cols_A = int(size_parts[1])  # Número de columnas de A
 
             # Crear el nombre del archivo para la segunda matriz rectangular
-            file_path_A = os.path.join(dataset_folder, filename)
             file_path_B = os.path.join(dataset_folder, f'rectangular_matrix_2_{num_cols_A}x{num_rows_A}.txt')
 
             # Comprobar si el archivo B existe
-            if os.path.exists(file_path_B):
-                # Cargar las matrices A y B
-                A = load_matrix_from_file(file_path_A)
-                B = load_matrix_from_file(file_path_B)
+            if dataset_exists(file_path_B):
+                pairs.append({
+                    "path_A": os.path.join(dataset_folder, filename),
+                    "path_B": file_path_B,
+                    "size": f"{num_rows_A}x{num_cols_A}",
+                    "result_name": f"rectangular_matrix_result_{num_rows_A}x{num_cols_A}.txt",
+                })
+            else:
+                print(f"Archivo {file_path_B} no encontrado. No se puede realizar la multiplicación.")
+    return pairs
 
-                # Aplicar cada algoritmo de multiplicación de matrices
-                for algorithm in algorithms:
-                    C, elapsed_time = measure_multiplication_time(algorithm, A, B)
+# Función para aplicar un algoritmo a un par de matrices y guardar sus resultados
+def run_multiplication_job(pair, algorithm, A=None, B=None, writer=None, output_mode="text",
+                           cache=None, force=False, **timing_options):
+    """Multiplica el par `pair` con `algorithm`, guarda la matriz resultante y retorna el registro de tiempo.
 
-                    # Guardar la matriz resultante
-                    result_file = f"Result_of_{algorithm}/rectangular_matrix_result_{num_rows_A}x{num_cols_A}.txt"
-                    save_matrix_to_file(C, result_file)
+    `writer`, `output_mode`, `cache` y `force` funcionan igual que en AnalisarArreglos.run_sorting_job.
+    """
+    record = {"algorithm": algorithm, "data_type": dataset_kind(pair["path_A"]), "size": pair["size"]}
+    result_file = f"Result_of_{algorithm}/{pair['result_name']}"
+    output_mode = writer.mode if writer is not None else output_mode
 
-                    # Guardar el tiempo de ejecución
-                    save_multiplication_time(algorithm, f"{num_rows_A}x{num_cols_A}", elapsed_time)
-            else:
-                print(f"Archivo {file_path_B} no encontrado. No se puede realizar la multiplicación.")
-# Función para rellenar matrices si el tamaño no es potencia de 2
-def pad_matrices(A, B):
-    n = len(A)
-    m = 2**math.ceil(math.log2(n))  # Encuentra el tamaño más cercano que es potencia de 2
-    if n == m:
-        return A, B  # Si ya es potencia de 2, no se hace nada
-
-    # Rellenar matrices con ceros
-    A_padded = [[A[i][j] if i < n and j < n else 0 for j in range(m)] for i in range(m)]
-    B_padded = [[B[i][j] if i < n and j < n else 0 for j in range(m)] for i in range(m)]
+    if cache:
+        key = cache_key("matrix", algorithm,
+                        [dataset_hash(pair["path_A"], cache), dataset_hash(pair["path_B"], cache)],
+                        code_fingerprint(MULTIPLICATION_FUNCTIONS[algorithm]),
+                        {**algorithm_params(algorithm), **timing_options})
+        entry = None if force else lookup(key, cache)
+        if entry is not None and os.path.exists(result_path(result_file, output_mode)):
+            return {**record, "time": entry["stats"]["median"], **entry["stats"], "cached": True}
+
+    if A is None:
+        A = load_matrix_from_file(pair["path_A"])
+    if B is None:
+        B = load_matrix_from_file(pair["path_B"])
+
+    C, stats = measure_multiplication_time(algorithm, A, B, **timing_options)
+    elapsed_time = stats["median"]
+
+    # Solo se guardan en el caché resultados verificados (Freivalds)
+    if cache:
+        if verify_product(A, B, C):
+            checksum, shape = result_checksum(C)
+            store(key, "matrix", algorithm, pair["path_A"], checksum, shape, stats, cache)
+        else:
+            print(f"{algorithm} multiplicó incorrectamente {pair['path_A']}; el resultado no se guarda en el caché.")
+
+    # Guardar la matriz resultante
+    if writer is not None:
+        writer.submit(C, result_file)
+    else:
+        write_result(C, result_file, output_mode)
+
+    return {**record, "time": elapsed_time, **stats}
+
+# Función para procesar todos los archivos y aplicar los algoritmos
+def process_matrix_datasets(output_mode="text", cache=DEFAULT_CACHE, force=False, instrument=False):
+    """Aplica cada algoritmo a cada par; las celdas sin cambios se toman del caché (`cache`=None lo desactiva)."""
+    dataset_folder = "matrix_datasets"
+    algorithms = MULTIPLICATION_ALGORITHMS
+
+    # En los modos binary y checksum las matrices resultantes se guardan en un hilo aparte mientras corre
+    # el siguiente algoritmo; el modo text se escribe en el mismo hilo, entre mediciones
+    with ResultWriter(output_mode) as writer:
+        for pair in matrix_dataset_pairs(dataset_folder):
+            A = load_matrix_from_file(pair["path_A"])
+            B = load_matrix_from_file(pair["path_B"])
+
+            # Aplicar cada algoritmo de multiplicación de matrices
+            records = [run_multiplication_job(pair, algorithm, A, B, writer, cache=cache, force=force,
+                                              instrument=instrument)
+                       for algorithm in algorithms]
+
+            # Guardar los tiempos nuevos en el almacén de resultados
+            measured = [r for r in records if not r.get("cached")]
+            if measured:
+                record_results(measured, "matrix")
+
+# Funciones para rellenar matrices (solo para los algoritmos que lo necesitan, como Strassen)
+def strassen_levels(size, threshold):
+    """Número de niveles de recursión hasta que la dimensión mayor quede <= `threshold`."""
+    levels = 0
+    while size > threshold:
+        size = -(-size // 2)
+        levels += 1
+    return levels
+
+def _padded_size(size, levels):
+    """Menor múltiplo de 2^niveles que es >= `size` (en vez de la siguiente potencia de 2)."""
+    step = 1 << levels
+    return -(-size // step) * step
+
+def pad_matrices(A, B, threshold=64):
+    """Rellena A (m×p) y B (p×n) con ceros para que Strassen pueda dividir cada dimensión
+    a la mitad hasta llegar al umbral. Cada dimensión se rellena por separado."""
+    m, p, n = len(A), len(B), len(B[0])
+    levels = strassen_levels(max(m, p, n), threshold)
+    m_pad, p_pad, n_pad = (_padded_size(d, levels) for d in (m, p, n))
+    if (m_pad, p_pad, n_pad) == (m, p, n):
+        return A, B  # No hace falta rellenar
+
+    A_padded = [list(row) + [0] * (p_pad - p) for row in A] + [[0] * p_pad for _ in range(m_pad - m)]
+    B_padded = [list(row) + [0] * (n_pad - n) for row in B] + [[0] * n_pad for _ in range(p_pad - p)]
     return A_padded, B_padded
 
+def _pad_array(A, levels, dtype):
+    """Versión NumPy de pad_matrices: solo copia si hay que cambiar el tipo o rellenar."""
+    rows, cols = (_padded_size(d, levels) for d in A.shape)
+    if (rows, cols) == A.shape:
+        return np.ascontiguousarray(A, dtype=dtype)
+    padded = np.zeros((rows, cols), dtype=dtype)
+    padded[:A.shape[0], :A.shape[1]] = A
+    return padded
+
+def crop_matrix(C, rows, cols):
+    """Quita las filas y columnas de relleno del resultado."""
+    if len(C) == rows and (rows == 0 or len(C[0]) == cols):
+        return C
+    return [row[:cols] for row in C[:rows]]
+
 # Ejecutar el proceso de análisis de matrices
-process_matrix_datasets()
-print("Análisis de matrices completado!")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multiplica cada par de matrix_datasets con cada algoritmo.")
+    parser.add_argument("--force", "--forzar", action="store_true", help="recalcular aunque el resultado esté en el caché")
+    parser.add_argument("--sin-cache", action="store_true", help="no leer ni escribir el caché de resultados")
+    parser.add_argument("--salida", choices=["text", "binary", "checksum"], default="text")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="agregar contadores de operaciones a cada registro (ver Instrumentacion)")
+    args = parser.parse_args()
+
+    process_matrix_datasets(args.salida, None if args.sin_cache else DEFAULT_CACHE, args.force, args.instrumentar)
+    print("Análisis de matrices completado!")
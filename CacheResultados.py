@@ -0,0 +1,227 @@
+import numpy as np
+import os
+import json
+import time
+import inspect
+import hashlib
+import sqlite3
+
+from AlmacenResultados import machine_info
+from FormatoBinario import binary_path_for, load_array, read_header
+
+###########################################################
+########CACHÉ DE RESULTADOS (DATASET + CÓDIGO)#############
+###########################################################
+
+# Caché persistente: si el dataset, el código del algoritmo y los parámetros no cambiaron,
+# se reutilizan las estadísticas de tiempo y el checksum del resultado verificado
+DEFAULT_CACHE = "cache_resultados.sqlite"
+MAX_ENTRIES = 100000
+MAX_BYTES = 64 * 2**20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    suite TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    shape TEXT NOT NULL,
+    stats TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_used);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+"""
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+# Función para identificar el contenido de un dataset
+def dataset_hash(path, db_path=DEFAULT_CACHE, block_elements=1 << 22):
+    """SHA-256 del contenido del dataset (dtype, forma y valores de su binario).
+
+    El hash se recuerda por (ruta, mtime, tamaño) del binario para no releer datasets que no cambiaron.
+    """
+    load_array(path)  # Asegura que exista el binario actualizado
+    bin_path = os.path.abspath(binary_path_for(path))
+    info = os.stat(bin_path)
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT digest FROM files WHERE path = ? AND mtime_ns = ? AND size = ?",
+                           (bin_path, info.st_mtime_ns, info.st_size)).fetchone()
+        if row:
+            return row[0]
+
+        dtype, shape, _ = read_header(bin_path)
+        data = load_array(bin_path)
+        digest = hashlib.sha256(f"{dtype.str} {shape}".encode())
+        for start in range(0, len(data), block_elements):
+            digest.update(np.ascontiguousarray(data[start:start + block_elements]).tobytes())
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                         (bin_path, info.st_mtime_ns, info.st_size, digest.hexdigest()))
+        return digest.hexdigest()
+    finally:
+        conn.close()
+
+_code_fingerprints = {}
+
+# Función para identificar el código de un algoritmo
+def code_fingerprint(func):
+    """SHA-256 del código fuente de `func` y de las funciones del proyecto que usa (vía co_names),
+    junto con las constantes de módulo que lee. Editar un algoritmo solo cambia la huella de los
+    algoritmos que lo usan."""
+    if func in _code_fingerprints:
+        return _code_fingerprints[func]
+    digest = hashlib.sha256()
+    seen = set()
+    pending = [func]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        digest.update(f"{current.__module__}.{current.__qualname__}\n".encode())
+        try:
+            digest.update(inspect.getsource(current).encode())
+        except (OSError, TypeError):
+            digest.update(current.__code__.co_code)
+        for name in sorted(_referenced_names(current.__code__), reverse=True):
+            value = current.__globals__.get(name)
+            if inspect.isfunction(value) and _is_project_function(value):
+                pending.append(value)
+            elif isinstance(value, (bool, int, float, str, bytes, tuple)):
+                digest.update(f"{name}={value!r}\n".encode())
+            elif isinstance(value, (set, frozenset)):
+                digest.update(f"{name}={sorted(value, key=repr)!r}\n".encode())
+    _code_fingerprints[func] = digest.hexdigest()
+    return _code_fingerprints[func]
+
+def _referenced_names(code):
+    """Nombres globales que usa `code`, incluyendo los de sus lambdas y funciones internas."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _referenced_names(const)
+    return names
+
+def _is_project_function(func):
+    try:
+        folder = os.path.dirname(os.path.abspath(inspect.getfile(func)))
+    except TypeError:
+        return False
+    return folder == os.path.dirname(os.path.abspath(__file__))
+
+# Función para armar la clave de una celda (dataset, algoritmo)
+def cache_key(suite, algorithm, dataset_hashes, code, params=None):
+    """Clave de caché: contenido de los datasets + huella del código + parámetros + máquina."""
+    payload = json.dumps({"suite": suite, "algorithm": algorithm, "datasets": list(dataset_hashes),
+                          "code": code, "params": params or {}, "machine": machine_info()},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+# Funciones para leer y escribir el caché
+def lookup(key, db_path=DEFAULT_CACHE):
+    """Retorna la entrada guardada (checksum, shape, stats) o None; actualiza su último uso (LRU)."""
+    if not os.path.exists(db_path):
+        return None
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT checksum, shape, stats FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with conn:
+            conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+    finally:
+        conn.close()
+    return {"checksum": row[0], "shape": tuple(json.loads(row[1])), "stats": json.loads(row[2])}
+
+def store(key, suite, algorithm, dataset, checksum, shape, stats, db_path=DEFAULT_CACHE,
+          max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """Guarda (o reemplaza) una entrada y aplica el desalojo por cantidad y tamaño."""
+    shape_json = json.dumps(list(shape))
+    stats_json = json.dumps(stats, sort_keys=True, default=str)
+    size_bytes = len(key) + len(dataset) + len(checksum) + len(shape_json) + len(stats_json)
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         (key, suite, algorithm, dataset, checksum, shape_json, stats_json, now, now, size_bytes))
+        _evict(conn, max_entries, max_bytes)
+    finally:
+        conn.close()
+
+def _evict(conn, max_entries, max_bytes):
+    count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()
+    if count <= max_entries and total <= max_bytes:
+        return
+    doomed = []
+    for key, size_bytes in conn.execute("SELECT key, size_bytes FROM entries ORDER BY last_used"):
+        if count <= max_entries and total <= max_bytes:
+            break
+        doomed.append((key,))
+        count -= 1
+        total -= size_bytes
+    with conn:
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+def evict(db_path=DEFAULT_CACHE, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """Elimina las entradas usadas hace más tiempo hasta quedar bajo `max_entries` y `max_bytes`."""
+    conn = _connect(db_path)
+    try:
+        _evict(conn, max_entries, max_bytes)
+    finally:
+        conn.close()
+
+def invalidate(db_path=DEFAULT_CACHE, suite=None, algorithm=None):
+    """Borra las entradas de `suite`/`algorithm` (todas si no se indica ninguno)."""
+    if not os.path.exists(db_path):
+        return
+    filters, params = [], []
+    for column, value in (("suite", suite), ("algorithm", algorithm)):
+        if value is not None:
+            filters.append(f"{column} = ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(filters)}" if filters else ""
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute(f"DELETE FROM entries {where}", params)
+    finally:
+        conn.close()
+
+# Funciones para verificar un resultado antes de guardarlo en el caché
+def verify_sorted(data, result):
+    """Compara el resultado con np.sort de la entrada."""
+    return np.array_equal(np.asarray(result), np.sort(np.asarray(data)))
+
+def verify_product(A, B, C, rounds=2, seed=0):
+    """Verificación de Freivalds: A·(B·r) == C·r para vectores r de 0/1 (error < 2^-rounds), en O(n²)."""
+    A, B, C = np.asarray(A), np.asarray(B), np.asarray(C)
+    if C.shape != (A.shape[0], B.shape[1]):
+        return False
+    if C.size == 0:
+        return True
+    # max|X| sin np.abs, que desborda en INT64_MIN
+    magnitude = lambda X: max(-int(X.min()), int(X.max())) if X.size else 0
+    bound = A.shape[1] * B.shape[1] * magnitude(A) * magnitude(B)
+    if C.dtype == object or bound >= 2 ** 63:
+        A, B, C = A.astype(object), B.astype(object), C.astype(object)
+    rng = np.random.default_rng(seed)
+    for _ in range(rounds):
+        r = rng.integers(0, 2, B.shape[1]).astype(C.dtype)
+        if not np.array_equal(A.dot(B.dot(r)), C.dot(r)):
+            return False
+    return True
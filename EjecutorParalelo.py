@@ -0,0 +1,133 @@
+import os
+import math
+import time
+import logging
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from AlmacenResultados import record_results
+from AnalisarArreglos import SORTING_ALGORITHMS, run_sorting_job
+from AnalisarMatrix import MULTIPLICATION_ALGORITHMS, matrix_dataset_pairs, run_multiplication_job
+from FormatoBinario import list_datasets
+
+###########################################################
+########EJECUCIÓN PARALELA DE LOS BENCHMARKS###############
+###########################################################
+
+# Costo relativo esperado de cada algoritmo según el tamaño (solo se usa para ordenar los trabajos)
+SORTING_COST = {
+    "bubble_sort": lambda n: n * n,
+    "counting_sort": lambda n: n,
+}
+MULTIPLICATION_COST = {
+    "strassen": lambda m, k, n: (max(m, k, n) ** 2.807) * 4,
+}
+
+def _sorting_cost(algorithm, n):
+    model = SORTING_COST.get(algorithm, lambda n: n * max(1.0, math.log2(max(n, 2))))
+    return model(n)
+
+def _multiplication_cost(algorithm, m, k, n):
+    model = MULTIPLICATION_COST.get(algorithm, lambda m, k, n: m * k * n)
+    return model(m, k, n)
+
+# Función para construir la lista de trabajos (dataset, algoritmo)
+def build_jobs(sort_folder="datasets_a", matrix_folder="matrix_datasets",
+               sort_algorithms=None, matrix_algorithms=None):
+    """Retorna los trabajos ordenados de mayor a menor costo esperado (LPT)."""
+    jobs = []
+    if sort_folder:
+        for filename in list_datasets(sort_folder):
+            n = int(filename.split('_')[-1].replace('.txt', ''))
+            for algorithm in sort_algorithms or SORTING_ALGORITHMS:
+                jobs.append({"kind": "sort", "algorithm": algorithm,
+                             "file_path": os.path.join(sort_folder, filename),
+                             "cost": _sorting_cost(algorithm, n)})
+    if matrix_folder:
+        for pair in matrix_dataset_pairs(matrix_folder):
+            m, k = map(int, pair["size"].split('x'))
+            for algorithm in matrix_algorithms or MULTIPLICATION_ALGORITHMS:
+                jobs.append({"kind": "matrix", "algorithm": algorithm, "pair": pair,
+                             "cost": _multiplication_cost(algorithm, m, k, m)})
+
+    # Primero los trabajos más largos para que no queden al final con núcleos ociosos
+    jobs.sort(key=lambda job: job["cost"], reverse=True)
+    return jobs
+
+# Funciones que corren dentro de cada proceso trabajador
+def _init_worker(log_level, core_queue=None):
+    """Configura el log como en el proceso principal (decisiones de auto_sort) y, con `core_queue`,
+    fija el proceso trabajador a un núcleo distinto para aislar las mediciones."""
+    logging.basicConfig(level=log_level, format="%(message)s")
+    if core_queue is None:
+        return
+    core = core_queue.get()
+    if core is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {core})
+
+def _run_job(job):
+    if job["kind"] == "sort":
+        record = run_sorting_job(job["file_path"], job["algorithm"])
+    else:
+        record = run_multiplication_job(job["pair"], job["algorithm"])
+    record["kind"] = job["kind"]
+    record["worker"] = os.getpid()
+    return record
+
+# Función para ejecutar todos los trabajos en un pool de procesos
+def run_parallel(jobs, workers=None, pin_cpus=False):
+    """Ejecuta `jobs` en un ProcessPoolExecutor (un trabajo por proceso a la vez) y retorna los registros."""
+    if hasattr(os, "sched_getaffinity"):
+        available = sorted(os.sched_getaffinity(0))
+    else:
+        available = list(range(os.cpu_count() or 1))
+    workers = workers or len(available)
+
+    initargs = (logging.getLogger().getEffectiveLevel(),)
+    if pin_cpus:
+        core_queue = mp.Queue()
+        for i in range(workers):
+            core_queue.put(available[i % len(available)])
+        initargs += (core_queue,)
+
+    records = []
+    start_time = time.time()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        futures = {pool.submit(_run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                records.append(future.result())
+            except Exception as error:
+                print(f"Falló {job['algorithm']} ({job.get('file_path') or job['pair']['path_A']}): {error}")
+    wall_time = time.time() - start_time
+
+    records.sort(key=lambda r: (r["kind"], r["algorithm"], r["data_type"], str(r["size"])))
+    return records, wall_time
+
+# Función para mostrar los resultados como una tabla
+def format_table(records):
+    lines = [f"{'algoritmo':<22}{'dataset':<24}{'tamaño':>12}{'tiempo (s)':>16}"]
+    for r in records:
+        lines.append(f"{r['algorithm']:<22}{r['data_type']:<24}{str(r['size']):>12}{r['time']:>16.6f}")
+    return "\n".join(lines)
+
+# Ejecutar el barrido completo en paralelo
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ejecuta los benchmarks de ordenamiento y matrices en paralelo.")
+    parser.add_argument("--trabajadores", type=int, default=None, help="número de procesos (por defecto, uno por núcleo)")
+    parser.add_argument("--fijar-cpu", action="store_true", help="fijar cada proceso a un núcleo")
+    parser.add_argument("--solo", choices=["arreglos", "matrices", "todo"], default="todo")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")  # Decisiones de auto_sort
+    jobs = build_jobs(sort_folder=None if args.solo == "matrices" else "datasets_a",
+                      matrix_folder=None if args.solo == "arreglos" else "matrix_datasets")
+    records, wall_time = run_parallel(jobs, args.trabajadores, args.fijar_cpu)
+    for suite in ("sort", "matrix"):
+        suite_records = [r for r in records if r["kind"] == suite]
+        if suite_records:
+            record_results(suite_records, suite)
+    print(format_table(records))
+    print(f"{len(records)} trabajos completados en {wall_time:.2f} segundos")
@@ -0,0 +1,174 @@
+import numpy as np
+import os
+import queue
+import hashlib
+import threading
+
+from FormatoBinario import binary_path_for, write_binary
+
+###########################################################
+##########ESCRITURA RÁPIDA DE LOS RESULTADOS###############
+###########################################################
+
+# Modos de salida: texto (mismo formato de siempre), binario (.bin) o solo checksum (.sha256)
+OUTPUT_MODES = ("text", "binary", "checksum")
+
+def _ensure_folder(filename):
+    folder = os.path.dirname(filename)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+# Función para escribir texto por bloques sin construir un único string gigante
+def write_text_streaming(data, filename, chunk_elements=1 << 16):
+    """Escribe un arreglo (una línea, valores separados por espacio) o una matriz (una fila por línea).
+
+    Nunca formatea más de `chunk_elements` valores a la vez, así la memoria extra queda acotada.
+    """
+    _ensure_folder(filename)
+    with open(filename, 'w') as f:
+        if _is_matrix(data):
+            rows_per_chunk = max(1, chunk_elements // max(1, len(data[0])))
+            for r in range(0, len(data), rows_per_chunk):
+                block = data[r:r + rows_per_chunk]
+                block = block.tolist() if isinstance(block, np.ndarray) else block
+                f.write(''.join(' '.join(map(str, row)) + '\n' for row in block))
+        else:
+            for start in range(0, len(data), chunk_elements):
+                block = data[start:start + chunk_elements]
+                block = block.tolist() if isinstance(block, np.ndarray) else block
+                if start:
+                    f.write(' ')
+                f.write(' '.join(map(str, block)))
+            f.write('\n')
+
+def _is_matrix(data):
+    if isinstance(data, np.ndarray):
+        return data.ndim == 2
+    return len(data) > 0 and isinstance(data[0], (list, tuple, np.ndarray))
+
+def _as_int64(data):
+    """Convierte a int64; retorna None si algún valor no cabe (enteros de Python grandes)."""
+    try:
+        return np.asarray(data, dtype=np.int64)
+    except OverflowError:
+        return None
+
+# Función para escribir el resultado en formato binario
+def write_binary_result(data, filename, kind=None):
+    """Escribe `data` con FormatoBinario (ndarray.tofile); si no cabe en int64 se usa texto."""
+    array = _as_int64(data)
+    if array is None:
+        write_text_streaming(data, filename)
+        return filename
+    bin_path = binary_path_for(filename)
+    _ensure_folder(bin_path)
+    write_binary(array, bin_path, kind or "resultado")
+    return bin_path
+
+# Función para calcular el checksum de un resultado
+def result_checksum(data):
+    """SHA-256 de los valores (int64 little-endian) y la forma; independiente de list/ndarray."""
+    array = _as_int64(data)
+    digest = hashlib.sha256()
+    if array is None:
+        digest.update(repr(np.asarray(data, dtype=object).tolist()).encode())
+        shape = np.shape(data)
+    else:
+        digest.update(str(array.shape).encode())
+        digest.update(np.ascontiguousarray(array, dtype='<i8').tobytes())
+        shape = array.shape
+    return digest.hexdigest(), shape
+
+def write_checksum(data, filename):
+    checksum, shape = result_checksum(data)
+    path = result_path(filename, "checksum")
+    _ensure_folder(path)
+    with open(path, 'w') as f:
+        f.write(f"{checksum} {'x'.join(map(str, shape))}\n")
+    return path
+
+def result_path(filename, mode="text"):
+    """Ruta del archivo que deja write_result para `filename` en el modo `mode`."""
+    if mode == "binary":
+        return binary_path_for(filename)
+    if mode == "checksum":
+        return os.path.splitext(filename)[0] + ".sha256"
+    return filename
+
+# Función para guardar un resultado según el modo de salida
+def write_result(data, filename, mode="text"):
+    if mode == "text":
+        write_text_streaming(data, filename)
+        return filename
+    if mode == "binary":
+        return write_binary_result(data, filename)
+    if mode == "checksum":
+        return write_checksum(data, filename)
+    raise ValueError(f"Modo de salida desconocido: {mode}")
+
+# Modos que se escriben en segundo plano (sobre un ndarray liberan el GIL: no afectan la medición en curso)
+BACKGROUND_MODES = {"binary", "checksum"}
+
+# Escritor en segundo plano: el siguiente benchmark empieza mientras se guarda el anterior
+class ResultWriter:
+    """Hilo que escribe los resultados encolados con `submit`.
+
+    La cola tiene un máximo de `max_pending` resultados para acotar la memoria. Solo los modos
+    "binary" y "checksum", que sobre un ndarray liberan el GIL casi todo el tiempo, se escriben en
+    segundo plano; el modo "text" formatea en Python y competiría por el GIL con el algoritmo que
+    se está midiendo, así que se escribe en el mismo hilo dentro de `submit`, fuera de la medición.
+    """
+
+    def __init__(self, mode="text", max_pending=2):
+        if mode not in OUTPUT_MODES:
+            raise ValueError(f"Modo de salida desconocido: {mode}")
+        self.mode = mode
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = None
+        if mode in BACKGROUND_MODES:
+            self._thread = threading.Thread(target=self._run, name="ResultWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                data, filename = item
+                if self._error is None:
+                    write_result(data, filename, self.mode)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def submit(self, data, filename):
+        """Encola `data` para escribirlo en `filename`; bloquea si ya hay `max_pending` en espera.
+
+        Las listas de Python se convierten a ndarray aquí, en el hilo que llama (fuera de la
+        medición): convertirlas o recorrerlas en el hilo de escritura retendría el GIL. Lo que no
+        cabe en int64 se escribe en el mismo hilo.
+        """
+        if self._error is not None:
+            raise self._error
+        array = _as_int64(data) if self._thread is not None else None
+        if array is None:
+            write_result(data, filename, self.mode)
+        else:
+            self._queue.put((array, filename))
+
+    def close(self):
+        """Espera a que se escriba todo lo encolado y relanza cualquier error de escritura."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
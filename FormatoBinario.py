@@ -0,0 +1,171 @@
+import numpy as np
+import os
+import json
+
+###########################################################
+############FORMATO BINARIO PARA LOS DATASETS##############
+###########################################################
+
+# Cabecera fija: 8 bytes mágicos + JSON (dtype, shape, kind) rellenado con espacios.
+# Los datos quedan alineados a 128 bytes y se leen con np.memmap sin copiar.
+MAGIC = b"TAREA1B\x00"
+HEADER_SIZE = 128
+BINARY_EXTENSION = ".bin"
+
+def binary_path_for(filename):
+    """Retorna la ruta del archivo binario asociado a un dataset de texto."""
+    base, ext = os.path.splitext(filename)
+    return filename if ext == BINARY_EXTENSION else base + BINARY_EXTENSION
+
+def dataset_kind(filename):
+    """Infiere el tipo de generador a partir del nombre (`random_100.txt` -> `random`)."""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return stem.rsplit('_', 1)[0]
+
+def _encode_header(dtype, shape, kind):
+    header = json.dumps({"dtype": np.dtype(dtype).str, "shape": list(shape), "kind": kind}).encode()
+    if len(MAGIC) + len(header) + 1 > HEADER_SIZE:
+        raise ValueError(f"Cabecera demasiado grande para {HEADER_SIZE} bytes: {header!r}")
+    return MAGIC + header.ljust(HEADER_SIZE - len(MAGIC) - 1) + b"\n"
+
+def read_header(filename):
+    """Lee la cabecera de un archivo binario y retorna (dtype, shape, kind)."""
+    with open(filename, 'rb') as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) != HEADER_SIZE or not raw.startswith(MAGIC):
+        raise ValueError(f"{filename} no es un dataset binario válido")
+    header = json.loads(raw[len(MAGIC):].decode())
+    return np.dtype(header["dtype"]), tuple(header["shape"]), header["kind"]
+
+# Función para guardar un arreglo o matriz en formato binario
+def write_binary(array, filename, kind=None):
+    """Guarda `array` (1-D o 2-D) con su cabecera, escribiendo los datos directo desde el buffer."""
+    array = np.ascontiguousarray(array)
+    kind = kind if kind is not None else dataset_kind(filename)
+    with open(filename, 'wb') as f:
+        f.write(_encode_header(array.dtype, array.shape, kind))
+        array.tofile(f)
+
+def create_binary(filename, shape, dtype=np.int64, kind=None):
+    """Crea un archivo binario vacío y retorna un memmap escribible para llenarlo por bloques."""
+    kind = kind if kind is not None else dataset_kind(filename)
+    with open(filename, 'wb') as f:
+        f.write(_encode_header(dtype, shape, kind))
+    return np.memmap(filename, dtype=dtype, mode='r+', offset=HEADER_SIZE, shape=tuple(shape))
+
+# Función para abrir un archivo binario sin copiarlo a memoria
+def open_binary(filename, mode='r'):
+    """Abre un dataset binario como np.memmap; las páginas se cargan bajo demanda."""
+    dtype, shape, _ = read_header(filename)
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)  # mmap no admite archivos de largo cero
+    return np.memmap(filename, dtype=dtype, mode=mode, offset=HEADER_SIZE, shape=shape)
+
+# Función para convertir un dataset de texto al formato binario
+def _parse_integers(chunk):
+    # np.fromstring de un bloque solo con espacios retorna [0], no un arreglo vacío
+    if not chunk.strip():
+        return np.empty(0, dtype=np.int64)
+    return np.fromstring(chunk, dtype=np.int64, sep=' ')
+
+def convert_text_to_binary(text_path, bin_path=None, kind=None, block_size=1 << 24):
+    """Convierte un dataset de texto leyendo por bloques, de modo que no necesita caber en memoria."""
+    bin_path = bin_path or binary_path_for(text_path)
+    kind = kind if kind is not None else dataset_kind(text_path)
+    tmp_path = f"{bin_path}.{os.getpid()}.tmp"
+    rows = count = 0
+    line_has_data = False
+    leftover = b""
+
+    with open(text_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+        dst.write(b"\x00" * HEADER_SIZE)
+        while True:
+            block = src.read(block_size)
+            if not block:
+                break
+            block = leftover + block
+            # Cortar en el último separador para no partir un número entre bloques
+            cut = max(block.rfind(sep) for sep in (b" ", b"\n", b"\t", b"\r"))
+            if cut == -1:
+                leftover = block
+                continue
+            chunk, leftover = block[:cut + 1], block[cut + 1:]
+
+            lines = chunk.split(b"\n")
+            for line in lines[:-1]:
+                if line_has_data or line.strip():
+                    rows += 1
+                line_has_data = False
+            line_has_data = line_has_data or bool(lines[-1].strip())
+
+            values = _parse_integers(chunk)
+            values.tofile(dst)
+            count += values.size
+
+        if leftover.strip():
+            values = _parse_integers(leftover)
+            values.tofile(dst)
+            count += values.size
+            line_has_data = True
+        if line_has_data:
+            rows += 1
+
+        # Una sola línea es un arreglo; varias líneas son las filas de una matriz
+        if rows <= 1:
+            shape = (count,)
+        else:
+            if count % rows != 0:
+                raise ValueError(f"{text_path}: las filas no tienen el mismo número de columnas")
+            shape = (rows, count // rows)
+        dst.seek(0)
+        dst.write(_encode_header(np.int64, shape, kind))
+
+    os.replace(tmp_path, bin_path)
+    return bin_path
+
+# Funciones para cargar datasets (convirtiendo el texto la primera vez)
+def _ensure_binary(filename):
+    bin_path = binary_path_for(filename)
+    if filename != bin_path and os.path.exists(filename):
+        if not os.path.exists(bin_path) or os.path.getmtime(bin_path) < os.path.getmtime(filename):
+            convert_text_to_binary(filename, bin_path)
+    return bin_path
+
+def load_array(filename):
+    """Carga un arreglo 1-D como memmap; `filename` puede ser el .txt original o el .bin."""
+    data = open_binary(_ensure_binary(filename))
+    return data.reshape(-1)
+
+# Funciones para cargar un arreglo en el tipo entero más pequeño que lo contiene
+def smallest_int_dtype(lo, hi):
+    """Menor tipo entero con signo (int8, int16, int32 o int64) que contiene el rango [lo, hi]."""
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+def load_typed_array(filename):
+    """Carga un arreglo 1-D en memoria como np.ndarray del tipo más pequeño posible (10^8 valores
+    entre 0 y 100 ocupan 100 MB en vez de los ~3.6 GB de una lista de Python)."""
+    data = load_array(filename)
+    if data.size == 0:
+        return np.empty(0, dtype=np.int8)
+    return np.array(data, dtype=smallest_int_dtype(int(data.min()), int(data.max())))
+
+def load_matrix(filename):
+    """Carga una matriz 2-D como memmap; `filename` puede ser el .txt original o el .bin."""
+    data = open_binary(_ensure_binary(filename))
+    return data.reshape(1, -1) if data.ndim == 1 else data
+
+def dataset_exists(filename):
+    return os.path.exists(filename) or os.path.exists(binary_path_for(filename))
+
+def list_datasets(folder):
+    """Lista los datasets de una carpeta por su nombre .txt, existan en texto, en binario o en ambos."""
+    names = set()
+    for filename in os.listdir(folder):
+        base, ext = os.path.splitext(filename)
+        if ext in (".txt", BINARY_EXTENSION):
+            names.add(base + ".txt")
+    return sorted(names)
@@ -1,69 +1,228 @@
 import numpy as np
-import random
 import os
 import time
+import argparse
+from math import isqrt
+from concurrent.futures import ProcessPoolExecutor
+
+from FormatoBinario import create_binary, write_binary
+
 
-    
 
 ###########################################################
 ################CREACION DE LOS DATASETS###################
 ###########################################################
 
-def generate_random_array(size):
+# Rango de valores de los datasets clásicos (0 a 100, como siempre)
+MAX_VALUE = 100
+# Cantidad de valores distintos en "few_unique"
+FEW_UNIQUE_VALUES = 8
+# Distancia máxima de cada elemento a su posición ordenada en "k_sorted"
+K_SORTED_DISTANCE = 16
+# Elementos por bloque al generar y escribir (acota la memoria para tamaños hasta 10^9)
+CHUNK_SIZE = 1 << 20
+
+# Funciones que generan cada distribución por bloques (ndarray int64 de a lo más `chunk_size`)
+def _runs_stream(values, counts, chunk_size):
+    """Emite np.repeat(values, counts) por bloques, sin materializar el arreglo completo."""
+    ends = np.cumsum(counts)
+    total = int(ends[-1]) if len(ends) else 0
+    for start in range(0, total, chunk_size):
+        stop = min(start + chunk_size, total)
+        yield values[np.searchsorted(ends, np.arange(start, stop), side='right')]
+
+def _sorted_stream(size, rng, chunk_size, reverse=False):
+    """Valores aleatorios entre 0 y MAX_VALUE ya ordenados: se sortean las frecuencias de cada valor."""
+    values = np.arange(MAX_VALUE + 1, dtype=np.int64)
+    counts = rng.multinomial(size, np.full(MAX_VALUE + 1, 1 / (MAX_VALUE + 1)))
+    if reverse:
+        values, counts = values[::-1], counts[::-1]
+    return _runs_stream(values, counts, chunk_size)
+
+def random_stream(size, rng, chunk_size=CHUNK_SIZE):
+    for start in range(0, size, chunk_size):
+        yield rng.integers(0, MAX_VALUE + 1, min(chunk_size, size - start))
+
+def sorted_stream(size, rng, chunk_size=CHUNK_SIZE):
+    return _sorted_stream(size, rng, chunk_size)
+
+def reverse_ordered_stream(size, rng, chunk_size=CHUNK_SIZE):
+    return _sorted_stream(size, rng, chunk_size, reverse=True)
+
+def semi_ordered_stream(size, rng, chunk_size=CHUNK_SIZE):
+    """Mitad ordenada y mitad aleatoria."""
+    midpoint = size // 2
+    yield from _sorted_stream(midpoint, rng, chunk_size)
+    yield from random_stream(size - midpoint, rng, chunk_size)
+
+def partially_ordered_stream(size, rng, chunk_size=CHUNK_SIZE):
+    """El primer 75% ordenado y el resto aleatorio."""
+    three_quarters = (3 * size) // 4
+    yield from _sorted_stream(three_quarters, rng, chunk_size)
+    yield from random_stream(size - three_quarters, rng, chunk_size)
+
+def few_unique_stream(size, rng, chunk_size=CHUNK_SIZE):
+    """Pocos valores distintos (FEW_UNIQUE_VALUES) repartidos al azar."""
+    values = rng.integers(0, 1 << 31, FEW_UNIQUE_VALUES)
+    for start in range(0, size, chunk_size):
+        yield values[rng.integers(0, FEW_UNIQUE_VALUES, min(chunk_size, size - start))]
+
+def sawtooth_stream(size, rng, chunk_size=CHUNK_SIZE):
+    """Rampas crecientes de largo ~sqrt(size) que se repiten."""
+    period = max(2, isqrt(size))
+    for start in range(0, size, chunk_size):
+        yield np.arange(start, min(start + chunk_size, size), dtype=np.int64) % period
+
+def organ_pipe_stream(size, rng, chunk_size=CHUNK_SIZE):
+    """Crece hasta la mitad y luego decrece (0, 1, ..., 1, 0)."""
+    for start in range(0, size, chunk_size):
+        index = np.arange(start, min(start + chunk_size, size), dtype=np.int64)
+        yield np.minimum(index, size - 1 - index)
+
+def k_sorted_stream(size, rng, chunk_size=CHUNK_SIZE):
+    """Cada elemento queda a menos de K_SORTED_DISTANCE posiciones de su lugar ordenado."""
+    k = K_SORTED_DISTANCE
+    step = max(k, chunk_size // k * k)  # Bloques alineados a k para barajar grupos completos
+    for start in range(0, size, step):
+        block = np.arange(start, min(start + step, size), dtype=np.int64)
+        full = len(block) // k * k
+        block[:full] = rng.permuted(block[:full].reshape(-1, k), axis=1).reshape(-1)
+        block[full:] = rng.permuted(block[full:])
+        yield block
+
+def large_range_stream(size, rng, chunk_size=CHUNK_SIZE):
+    """Claves en todo el rango de int64."""
+    info = np.iinfo(np.int64)
+    for start in range(0, size, chunk_size):
+        yield rng.integers(info.min, info.max, min(chunk_size, size - start), dtype=np.int64, endpoint=True)
+
+# El orden es parte de la semilla de cada dataset: agregar distribuciones solo al final
+DISTRIBUTIONS = {
+    "random": random_stream,
+    "semi_ordered": semi_ordered_stream,
+    "partially_ordered": partially_ordered_stream,
+    "reverse_ordered": reverse_ordered_stream,
+    "sorted": sorted_stream,
+    "few_unique": few_unique_stream,
+    "sawtooth": sawtooth_stream,
+    "organ_pipe": organ_pipe_stream,
+    "k_sorted": k_sorted_stream,
+    "large_range": large_range_stream,
+}
+
+def _collect(kind, size, rng):
+    rng = rng if rng is not None else np.random.default_rng()
+    chunks = list(DISTRIBUTIONS[kind](size, rng))
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+def generate_random_array(size, rng=None):
     """Genera un array completamente aleatorio de tamaño `size`."""
-    return np.random.randint(0, 101, size).tolist()
+    return _collect("random", size, rng)
 
-def generate_semi_ordered_array(size):
+def generate_semi_ordered_array(size, rng=None):
     """Genera un array semi ordenado con mitad ordenada y mitad aleatoria."""
-    array = generate_random_array(size)
-    midpoint = size // 2
-    array[:midpoint] = sorted(array[:midpoint])
-    return array
+    return _collect("semi_ordered", size, rng)
 
-def generate_partially_ordered_array(size):
+def generate_partially_ordered_array(size, rng=None):
     """Genera un array parcialmente ordenado donde el 75% está ordenado."""
-    array = generate_random_array(size)
-    three_quarters = (3 * size) // 4
-    array[:three_quarters] = sorted(array[:three_quarters])
-    return array
+    return _collect("partially_ordered", size, rng)
 
-def generate_reverse_ordered_array(size):
+def generate_reverse_ordered_array(size, rng=None):
     """Genera un array completamente ordenado en orden decreciente."""
-    array = sorted(generate_random_array(size), reverse=True)
-    return array
+    return _collect("reverse_ordered", size, rng)
 
-def generate_sorted_array(size):
+def generate_sorted_array(size, rng=None):
     """Genera un array completamente ordenado de menor a mayor."""
-    return sorted(generate_random_array(size))
+    return _collect("sorted", size, rng)
 
 def save_array_to_file(array, filename):
     """Guarda un array en un archivo de texto."""
     with open(filename, 'w') as f:
         f.write(' '.join(map(str, array)) + '\n')
 
-def generate_datasets():
-    """Genera 5 datasets por nivel de tamaño desde 10^1 hasta 10^5."""
-    sizes = [10**i for i in range(1, 6)]  # 10^1 hasta 10^5
-    
+def save_array_to_binary(array, filename, kind=None):
+    """Guarda un array en el formato binario (se lee luego con np.memmap)."""
+    write_binary(np.asarray(array, dtype=np.int64), filename, kind)
+
+# Función para escribir un dataset bloque a bloque en texto y/o binario
+def save_stream(chunks, basename, shape, formato="txt", kind=None):
+    """Escribe los bloques de `chunks` en `basename`.txt y/o `basename`.bin.
+
+    `shape` es (n,) para arreglos (una línea) o (filas, columnas) para matrices (bloques de filas).
+    """
+    if formato not in ("txt", "bin", "ambos"):
+        raise ValueError(f"Formato desconocido: {formato}")
+    is_matrix = len(shape) == 2
+    text = open(f"{basename}.txt", 'w') if formato in ("txt", "ambos") else None
+    binary = create_binary(f"{basename}.bin", shape, kind=kind) if formato in ("bin", "ambos") else None
+    flat = binary.reshape(-1) if binary is not None else None
+    position = 0
+    try:
+        for chunk in chunks:
+            if flat is not None:
+                flat[position:position + chunk.size] = chunk.reshape(-1)
+            if text is not None:
+                if is_matrix:
+                    text.write(''.join(' '.join(map(str, row)) + '\n' for row in chunk.tolist()))
+                else:
+                    text.write((' ' if position else '') + ' '.join(map(str, chunk.tolist())))
+            position += chunk.size
+        if text is not None and not is_matrix:
+            text.write('\n')
+    finally:
+        # El binario se cierra al final para que no quede más antiguo que el .txt
+        if text is not None:
+            text.close()
+        if binary is not None:
+            binary.flush()
+            del flat, binary
+
+def dataset_seed(seed, kind, size):
+    """SeedSequence propia de cada (distribución, tamaño), igual a la que entregaría `spawn`.
+
+    No depende de qué otros datasets se generen ni del número de procesos.
+    """
+    return np.random.SeedSequence(seed, spawn_key=(list(DISTRIBUTIONS).index(kind), size))
+
+def _generate_dataset(kind, size, seed, formato, folder, chunk_size):
+    rng = np.random.default_rng(dataset_seed(seed, kind, size))
+    basename = os.path.join(folder, f"{kind}_{size}")
+    save_stream(DISTRIBUTIONS[kind](size, rng, chunk_size), basename, (size,), formato, kind)
+    return basename
+
+def generate_datasets(formato="txt", sizes=None, kinds=None, seed=0, workers=None,
+                      chunk_size=CHUNK_SIZE, folder="datasets_a"):
+    """Genera un dataset por distribución y nivel de tamaño (por defecto desde 10^1 hasta 10^5).
+
+    `formato` puede ser "txt", "bin" o "ambos". Con la misma `seed` se obtienen los mismos datos;
+    los datasets se generan en paralelo con `workers` procesos (por defecto, uno por núcleo).
+    """
+    sizes = sizes or [10**i for i in range(1, 6)]  # 10^1 hasta 10^5
+    kinds = kinds or list(DISTRIBUTIONS)
+
     # Crear carpeta para guardar los datasets si no existe
-    if not os.path.exists("datasets_a"):
-        os.makedirs("datasets_a")
-
-    for size in sizes:
-        # Generar los 5 tipos de arrays
-        random_array = generate_random_array(size)
-        semi_ordered_array = generate_semi_ordered_array(size)
-        partially_ordered_array = generate_partially_ordered_array(size)
-        reverse_ordered_array = generate_reverse_ordered_array(size)
-        sorted_array = generate_sorted_array(size)
-        
-        # Guardar los arrays en archivos de texto
-        save_array_to_file(random_array, f'datasets_a/random_{size}.txt')
-        save_array_to_file(semi_ordered_array, f'datasets_a/semi_ordered_{size}.txt')
-        save_array_to_file(partially_ordered_array, f'datasets_a/partially_ordered_{size}.txt')
-        save_array_to_file(reverse_ordered_array, f'datasets_a/reverse_ordered_{size}.txt')
-        save_array_to_file(sorted_array, f'datasets_a/sorted_{size}.txt')
+    os.makedirs(folder, exist_ok=True)
+
+    # Los más grandes primero para repartir mejor el trabajo entre los procesos
+    jobs = sorted(((kind, size) for size in sizes for kind in kinds), key=lambda job: job[1], reverse=True)
+    if workers == 1:
+        return [_generate_dataset(kind, size, seed, formato, folder, chunk_size) for kind, size in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_generate_dataset, kind, size, seed, formato, folder, chunk_size)
+                   for kind, size in jobs]
+        return [future.result() for future in futures]
 
 # Ejecutar la generación de datasets
-generate_datasets()
-print("Datasets Generados!")
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera los datasets de arreglos.")
+    parser.add_argument("--formato", choices=["txt", "bin", "ambos"], default="txt")
+    parser.add_argument("--tamanos", type=lambda s: int(float(s)), nargs="+", default=None,
+                        help="tamaños a generar, p. ej. 1e3 1e6 1e9 (por defecto 10^1 hasta 10^5)")
+    parser.add_argument("--tipos", choices=list(DISTRIBUTIONS), nargs="+", default=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--trabajadores", type=int, default=None, help="número de procesos")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    generate_datasets(args.formato, args.tamanos, args.tipos, args.semilla, args.trabajadores)
+    print(f"Datasets Generados! ({time.time() - start_time:.2f} segundos)")
@@ -1,47 +1,90 @@
 import numpy as np
 import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from FormatoBinario import write_binary
+from GenerarArreglos import CHUNK_SIZE, MAX_VALUE, save_stream
+
+# Función para generar una matriz por bloques de filas
+def matrix_stream(rows, cols, rng, chunk_size=CHUNK_SIZE):
+    """Emite la matriz `rows` x `cols` (valores entre 0 y 100) en bloques de a lo más `chunk_size` elementos."""
+    rows_per_chunk = max(1, chunk_size // max(1, cols))
+    for start in range(0, rows, rows_per_chunk):
+        yield rng.integers(0, MAX_VALUE + 1, (min(rows_per_chunk, rows - start), cols))
 
 # Función para generar una matriz cuadrada
-def generate_square_matrix(size):
+def generate_square_matrix(size, rng=None):
     """Genera una matriz cuadrada de tamaño `size` x `size` con valores aleatorios entre 0 y 100."""
-    return np.random.randint(0, 101, (size, size))
+    return generate_rectangular_matrix(size, size, rng)
 
 # Función para generar una matriz rectangular
-def generate_rectangular_matrix(rows, cols):
+def generate_rectangular_matrix(rows, cols, rng=None):
     """Genera una matriz rectangular de tamaño `rows` x `cols` con valores aleatorios entre 0 y 100."""
-    return np.random.randint(0, 101, (rows, cols))
+    rng = rng if rng is not None else np.random.default_rng()
+    return rng.integers(0, MAX_VALUE + 1, (rows, cols))
 
 # Función para guardar matrices en archivos de texto
 def save_matrix_to_file(matrix, filename):
     """Guarda una matriz en un archivo de texto."""
     np.savetxt(filename, matrix, fmt='%d', delimiter=' ')
 
+# Función para guardar matrices en formato binario
+def save_matrix_to_binary(matrix, filename, kind=None):
+    """Guarda una matriz en el formato binario (se lee luego con np.memmap)."""
+    write_binary(np.asarray(matrix, dtype=np.int64), filename, kind)
+
+# Las cuatro matrices de cada tamaño; el índice es parte de la semilla de cada una
+MATRIX_SHAPES = {
+    "square_matrix_1": lambda size: (size, size),
+    "square_matrix_2": lambda size: (size, size),
+    "rectangular_matrix_1": lambda size: (size, size + 20),
+    "rectangular_matrix_2": lambda size: (size + 20, size),
+}
+
+def matrix_seed(seed, name, size):
+    """SeedSequence propia de cada (matriz, tamaño), igual a la que entregaría `spawn`."""
+    return np.random.SeedSequence(seed, spawn_key=(list(MATRIX_SHAPES).index(name), size))
+
+def _generate_matrix(name, size, seed, formato, folder, chunk_size):
+    rows, cols = MATRIX_SHAPES[name](size)
+    rng = np.random.default_rng(matrix_seed(seed, name, size))
+    basename = os.path.join(folder, f"{name}_{rows}x{cols}")
+    save_stream(matrix_stream(rows, cols, rng, chunk_size), basename, (rows, cols), formato)
+    return basename
+
 # Función para generar datasets de multiplicación de matrices
-def generate_matrix_datasets():
-    """Genera 5 datasets de matrices cuadradas y no cuadradas para diferentes tamaños."""
-    sizes = [10**i for i in range(1, 4)]  # Vamos de 10^1 hasta 10^3 por practicidad (ajusta según necesidad)
-    
+def generate_matrix_datasets(formato="txt", sizes=None, seed=0, workers=None,
+                             chunk_size=CHUNK_SIZE, folder="matrix_datasets"):
+    """Genera 4 matrices (2 cuadradas y 2 no cuadradas) por cada tamaño.
+
+    `formato` puede ser "txt", "bin" o "ambos". Con la misma `seed` se obtienen las mismas matrices;
+    se generan en paralelo con `workers` procesos (por defecto, uno por núcleo).
+    """
+    sizes = sizes or [10**i for i in range(1, 4)]  # Vamos de 10^1 hasta 10^3 por practicidad (ajusta según necesidad)
+
     # Crear carpeta para guardar los datasets si no existe
-    if not os.path.exists("matrix_datasets"):
-        os.makedirs("matrix_datasets")
-
-    for size in sizes:
-        # Generar matrices cuadradas de tamaño size x size
-        square_matrix_1 = generate_square_matrix(size)
-        square_matrix_2 = generate_square_matrix(size)
-        # Generar matrices rectangulares de diferentes dimensiones
-        rectangular_matrix_1 = generate_rectangular_matrix(size, size + 20)
-        rectangular_matrix_2 = generate_rectangular_matrix(size + 20, size)
-        
-
-        # Guardar las matrices cuadradas en archivos
-        save_matrix_to_file(square_matrix_1, f'matrix_datasets/square_matrix_1_{size}x{size}.txt')
-        save_matrix_to_file(square_matrix_2, f'matrix_datasets/square_matrix_2_{size}x{size}.txt')
-
-        # Guardar las matrices rectangulares en archivos
-        save_matrix_to_file(rectangular_matrix_1, f'matrix_datasets/rectangular_matrix_1_{size}x{size+20}.txt')
-        save_matrix_to_file(rectangular_matrix_2, f'matrix_datasets/rectangular_matrix_2_{size+20}x{size}.txt')
+    os.makedirs(folder, exist_ok=True)
+
+    jobs = sorted(((name, size) for size in sizes for name in MATRIX_SHAPES), key=lambda job: job[1], reverse=True)
+    if workers == 1:
+        return [_generate_matrix(name, size, seed, formato, folder, chunk_size) for name, size in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_generate_matrix, name, size, seed, formato, folder, chunk_size)
+                   for name, size in jobs]
+        return [future.result() for future in futures]
 
 # Ejecutar la generación de datasets
-generate_matrix_datasets()
-print("Datasets de matrices generados!")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera los datasets de matrices.")
+    parser.add_argument("--formato", choices=["txt", "bin", "ambos"], default="txt")
+    parser.add_argument("--tamanos", type=lambda s: int(float(s)), nargs="+", default=None,
+                        help="tamaños a generar, p. ej. 100 1e4 (por defecto 10, 100 y 1000)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--trabajadores", type=int, default=None, help="número de procesos")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    generate_matrix_datasets(args.formato, args.tamanos, args.semilla, args.trabajadores)
+    print(f"Datasets de matrices generados! ({time.time() - start_time:.2f} segundos)")
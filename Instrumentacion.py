@@ -0,0 +1,212 @@
+import sys
+import math
+
+from AnalisarArreglos import SORTING_FUNCTIONS
+from AnalisarMatrix import MULTIPLICATION_FUNCTIONS, multiply_matrices
+
+###########################################################
+#########INSTRUMENTACIÓN: CONTADORES DE OPERACIONES########
+###########################################################
+
+# Se instrumentan los algoritmos reales, sin copias: en una ejecución aparte reciben listas de
+# valores envueltos que cuentan cada comparación y cada operación aritmética, en una lista que
+# cuenta las escrituras, mientras un hook de sys.setprofile sigue la recursión y las listas nuevas.
+# Con la instrumentación desactivada los algoritmos corren sin cambios, así que el costo es cero.
+
+def new_counters():
+    """Contadores vacíos: comparaciones, movimientos de elementos, listas creadas (y sus bytes),
+    profundidad máxima de recursión y, para matrices, multiplicaciones/sumas escalares por nivel."""
+    return {"comparisons": 0, "moves": 0, "allocations": 0, "allocated_bytes": 0, "max_depth": 0,
+            "multiplies": 0, "adds": 0, "levels": {}}
+
+# Valor envuelto: cuenta comparaciones y operaciones escalares
+class CountedValue:
+    __slots__ = ("value", "counters")
+
+    def __init__(self, value, counters):
+        self.value = value
+        self.counters = counters
+
+    def _compare(self, other, op):
+        self.counters["comparisons"] += 1
+        return op(self.value, other.value if isinstance(other, CountedValue) else other)
+
+    def __lt__(self, other):
+        return self._compare(other, lambda a, b: a < b)
+
+    def __le__(self, other):
+        return self._compare(other, lambda a, b: a <= b)
+
+    def __gt__(self, other):
+        return self._compare(other, lambda a, b: a > b)
+
+    def __ge__(self, other):
+        return self._compare(other, lambda a, b: a >= b)
+
+    def __eq__(self, other):
+        return self._compare(other, lambda a, b: a == b)
+
+    def __ne__(self, other):
+        return self._compare(other, lambda a, b: a != b)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def _arithmetic(self, other, op, kind):
+        counters = self.counters
+        counters[kind] += 1
+        level = counters["levels"].setdefault(counters["_level"], {"multiplies": 0, "adds": 0})
+        level[kind] += 1
+        return CountedValue(op(self.value, other.value if isinstance(other, CountedValue) else other), counters)
+
+    def __mul__(self, other):
+        return self._arithmetic(other, lambda a, b: a * b, "multiplies")
+
+    def __rmul__(self, other):
+        return self._arithmetic(other, lambda a, b: b * a, "multiplies")
+
+    def __add__(self, other):
+        return self._arithmetic(other, lambda a, b: a + b, "adds")
+
+    def __radd__(self, other):
+        return self._arithmetic(other, lambda a, b: b + a, "adds")
+
+    def __sub__(self, other):
+        return self._arithmetic(other, lambda a, b: a - b, "adds")
+
+    def __rsub__(self, other):
+        return self._arithmetic(other, lambda a, b: b - a, "adds")
+
+# Lista que cuenta las escrituras de elementos (sus slices también son CountingList)
+class CountingList(list):
+    __slots__ = ("counters",)
+
+    def __init__(self, items, counters):
+        super().__init__(items)
+        self.counters = counters
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counters["moves"] += len(value)
+        else:
+            self.counters["moves"] += 1
+        super().__setitem__(index, value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountingList(super().__getitem__(index), self.counters)
+        return super().__getitem__(index)
+
+# Hook de perfil: profundidad de recursión, nivel de Strassen y listas nuevas del algoritmo
+class _Tracer:
+    """Sigue los marcos de Python del archivo del algoritmo. Al retornar cada función revisa sus
+    variables locales y su valor de retorno: cada lista (o fila de una lista de listas) que no se había
+    visto es una lista creada por el algoritmo. Los temporales que nunca quedan en una variable ni se
+    retornan (por ejemplo, la suma intermedia en `a + b + c`) no se ven."""
+
+    def __init__(self, filename, counters, level_code=None, initial=()):
+        self.filename = filename
+        self.counters = counters
+        self.level_code = level_code
+        self.depth = -1
+        self.seen = {id(obj): obj for obj in initial}  # Mantener las listas vivas: ids únicos
+
+    def __call__(self, frame, event, arg):
+        code = frame.f_code
+        if code.co_filename != self.filename or event not in ("call", "return"):
+            return
+        counters = self.counters
+        recursive = not code.co_name.startswith("<")  # Las comprensiones no son niveles de recursión
+        if event == "call":
+            self.depth += recursive
+            counters["max_depth"] = max(counters["max_depth"], self.depth)
+            if code is self.level_code:
+                counters["_level"] += 1
+            return
+        for value in list(frame.f_locals.values()) + [arg]:
+            self._register(value)
+        if code is self.level_code:
+            counters["_level"] -= 1
+        self.depth -= recursive
+
+    def _register(self, value, nested=True):
+        if isinstance(value, tuple):
+            for item in value:
+                self._register(item, nested)
+        elif isinstance(value, list) and id(value) not in self.seen:
+            self.seen[id(value)] = value
+            self.counters["allocations"] += 1
+            self.counters["allocated_bytes"] += sys.getsizeof(value)
+            if not isinstance(value, CountingList):
+                self.counters["moves"] += len(value)  # Elementos copiados a la lista nueva
+            if nested:
+                for item in value:
+                    if isinstance(item, list):
+                        self._register(item, nested=False)
+                    else:
+                        break
+
+def _traced(func, filename, counters, level_code=None, initial=()):
+    """Ejecuta `func()` con el hook activo y retorna su resultado."""
+    counters["_level"] = -1 if level_code is not None else 0
+    tracer = _Tracer(filename, counters, level_code, initial)
+    previous = sys.getprofile()
+    sys.setprofile(tracer)
+    try:
+        return func()
+    finally:
+        sys.setprofile(previous)
+        del counters["_level"]
+
+# Algoritmos que se pueden instrumentar (los que operan elemento a elemento en Python)
+INSTRUMENTED_SORTS = ["bubble_sort", "insertion_sort", "merge_sort", "adaptive_merge_sort", "quick_sort",
+                      "intro_sort", "sorted_builtin"]
+INSTRUMENTED_MULTIPLICATIONS = ["traditional", "optimized", "strassen"]
+
+# Costo teórico de cada algoritmo (comparaciones o multiplicaciones escalares esperadas)
+SORTING_MODELS = {
+    "bubble_sort": lambda n: n * (n - 1) / 2,
+    "merge_sort": lambda n: n * math.log2(n) if n > 1 else 1,
+    "quick_sort": lambda n: n * math.log2(n) if n > 1 else 1,
+}
+MULTIPLICATION_MODELS = {
+    "traditional": lambda m, p, n: m * p * n,
+    "optimized": lambda m, p, n: m * p * n,
+    "strassen": lambda m, p, n: max(m, p, n) ** math.log2(7),
+}
+
+# Funciones para contar las operaciones de una ejecución
+def count_sorting_operations(algorithm, arr):
+    """Ordena una copia de `arr` con el algoritmo real sobre valores instrumentados y retorna los contadores.
+
+    `ratio` (si hay modelo) compara las comparaciones con el modelo teórico (n²/2 o n·log2 n); si se
+    mantiene estable al crecer n, el algoritmo sigue la complejidad esperada.
+    """
+    if algorithm not in INSTRUMENTED_SORTS:
+        raise ValueError(f"No hay versión instrumentada de {algorithm}")
+    counters = new_counters()
+    values = arr.tolist() if hasattr(arr, "tolist") else list(arr)
+    data = CountingList((CountedValue(v, counters) for v in values), counters)
+    func = SORTING_FUNCTIONS[algorithm]
+    _traced(lambda: func(data), func.__code__.co_filename, counters, initial=[data])
+    if algorithm in SORTING_MODELS:
+        counters["ratio"] = counters["comparisons"] / max(1, SORTING_MODELS[algorithm](len(data)))
+    return counters
+
+def count_multiplication_operations(algorithm, A, B, threshold=64):
+    """Multiplica con el algoritmo real (A y B ya preparados: listas, rellenadas para Strassen) sobre
+    valores instrumentados y retorna los contadores; `levels` separa las operaciones escalares por nivel
+    de recursión de Strassen y `ratio` las compara con m·p·n o n^log2(7)."""
+    if algorithm not in INSTRUMENTED_MULTIPLICATIONS:
+        raise ValueError(f"No hay versión instrumentada de {algorithm}")
+    counters = new_counters()
+    X = [[CountedValue(v, counters) for v in row] for row in A]
+    Y = [[CountedValue(v, counters) for v in row] for row in B]
+    func = MULTIPLICATION_FUNCTIONS[algorithm]
+    level_code = func.__code__ if algorithm == "strassen" else None
+    _traced(lambda: multiply_matrices(algorithm, X, Y, threshold=threshold), func.__code__.co_filename, counters,
+            level_code, initial=[X, Y, *X, *Y])
+    m, p, n = len(A), len(B), len(B[0]) if B else 0
+    counters["ratio"] = counters["multiplies"] / max(1, MULTIPLICATION_MODELS[algorithm](m, p, n))
+    return counters
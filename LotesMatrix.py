@@ -0,0 +1,115 @@
+import numpy as np
+import os
+import argparse
+
+from AlmacenResultados import record_results
+from AnalisarMatrix import _exact_compute_dtype, _product_bound, exact_multiplication, optimized_multiplication
+from FormatoBinario import open_binary, smallest_int_dtype, write_binary
+from GenerarArreglos import MAX_VALUE
+from MedicionTiempo import benchmark
+
+###########################################################
+#######MULTIPLICACIÓN POR LOTES DE MATRICES PEQUEÑAS#######
+###########################################################
+
+# Carpeta con las pilas de matrices (un archivo por pila, no uno por par)
+BATCH_FOLDER = "matrix_batches"
+
+# Función para generar una pila de pares de matrices del mismo tamaño
+def generate_matrix_batch(count, rows, inner, cols, seed=0):
+    """Retorna (A, B) con forma (count, rows, inner) y (count, inner, cols), valores entre 0 y 100.
+
+    Con la misma `seed` y las mismas formas se obtienen las mismas pilas.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(count, rows, inner, cols)))
+    A = rng.integers(0, MAX_VALUE + 1, (count, rows, inner))
+    B = rng.integers(0, MAX_VALUE + 1, (count, inner, cols))
+    return A, B
+
+# Funciones para guardar y cargar una pila completa en un solo archivo binario
+def batch_paths(count, rows, inner, cols, folder=BATCH_FOLDER):
+    return (os.path.join(folder, f"batch_A_{count}x{rows}x{inner}.bin"),
+            os.path.join(folder, f"batch_B_{count}x{inner}x{cols}.bin"))
+
+def save_matrix_batch(A, B, path_A, path_B):
+    """Guarda cada pila con el menor tipo entero que contiene sus valores (int8 para 0..100)."""
+    os.makedirs(os.path.dirname(path_A) or ".", exist_ok=True)
+    for stack, path in ((A, path_A), (B, path_B)):
+        dtype = smallest_int_dtype(int(stack.min()), int(stack.max())) if stack.size else np.int64
+        write_binary(stack.astype(dtype), path, kind="batch")
+
+def load_matrix_batch(path_A, path_B):
+    """Abre las dos pilas como np.memmap: una lectura por pila en vez de una por par."""
+    return open_binary(path_A), open_binary(path_B)
+
+def matrix_batch(count, rows, inner, cols, seed=0, folder=BATCH_FOLDER):
+    """Carga la pila de `folder`; si no existe, la genera con `seed` y la guarda primero."""
+    path_A, path_B = batch_paths(count, rows, inner, cols, folder)
+    if not (os.path.exists(path_A) and os.path.exists(path_B)):
+        save_matrix_batch(*generate_matrix_batch(count, rows, inner, cols, seed), path_A, path_B)
+    return load_matrix_batch(path_A, path_B)
+
+# Multiplicación de toda la pila con un solo np.matmul sobre arreglos 3-D
+def batched_multiplication(A, B):
+    """Retorna la pila de productos A[i] @ B[i] (forma (count, rows, cols)), exactos como en exact_multiplication.
+
+    El tipo se elige una vez para toda la pila: float64 (BLAS) si la cota cabe en 2^53, si no int64;
+    no hace falta rellenar porque np.matmul acepta cualquier forma. Si la cota pasa de 2^63, cada
+    par se multiplica con exact_multiplication.
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    inner = A.shape[-1]
+    if _product_bound(A, B, inner) >= 2 ** 63:
+        return np.array([exact_multiplication(X, Y) for X, Y in zip(A, B)], dtype=object)
+    dtype = _exact_compute_dtype(A, B, inner)
+    C = np.matmul(A.astype(dtype, copy=False), B.astype(dtype, copy=False))
+    return np.rint(C).astype(np.int64) if dtype == np.float64 else C
+
+# Función para medir productos por segundo contra el bucle de optimized_multiplication
+def throughput_report(sizes=(10, 100), count=1000, loop_products=20, seed=0, folder=BATCH_FOLDER, record=True,
+                      **timing_options):
+    """Retorna una fila por tamaño con los productos por segundo del lote y del bucle de
+    optimized_multiplication (medido sobre los primeros `loop_products` pares, ya convertidos a listas).
+
+    Los resultados de ambos se comparan antes de reportar; con `record` las estadísticas por producto
+    (ver per_product) se guardan en el almacén de resultados (suite "matrix", data_type "batch").
+    """
+    rows = []
+    for size in sizes:
+        A, B = matrix_batch(count, size, size, size, seed, folder)
+        C, batched = benchmark(lambda: batched_multiplication(A, B), **timing_options)
+
+        subset = min(count, loop_products)
+        pairs = [(A[i].tolist(), B[i].tolist()) for i in range(subset)]
+        looped_C, looped = benchmark(lambda: [optimized_multiplication(X, Y) for X, Y in pairs], **timing_options)
+        if C[:subset].tolist() != looped_C:
+            raise AssertionError(f"La multiplicación por lotes no coincide con optimized_multiplication ({size}x{size})")
+
+        rows.append({"size": f"{size}x{size}", "count": count,
+                     "batched": count / batched["median"], "looped": subset / looped["median"],
+                     "speedup": (count / batched["median"]) / (subset / looped["median"])})
+        if record:
+            record_results([{"algorithm": "batched", "data_type": "batch", "size": f"{size}x{size}",
+                             **per_product(batched, count)},
+                            {"algorithm": "optimized_loop", "data_type": "batch", "size": f"{size}x{size}",
+                             **per_product(looped, subset)}], "matrix")
+    return rows
+
+def per_product(stats, products):
+    """Estadísticas de una llamada que calcula `products` productos, expresadas por producto."""
+    scaled = {key: stats[key] / products for key in ("min", "median", "p95", "mean", "stddev")}
+    return {**stats, **scaled, "time": scaled["median"]}
+
+# Ejecutar el reporte de productos por segundo
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Productos por segundo del lote (np.matmul 3-D) contra el bucle.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--cantidad", type=int, default=1000, help="pares de matrices por pila")
+    parser.add_argument("--bucle", type=int, default=20, help="pares que se miden con el bucle de optimized_multiplication")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'tamaño':<10}{'pares':>8}{'lote (prod/s)':>16}{'bucle (prod/s)':>16}{'speedup':>10}")
+    for row in throughput_report(args.tamanos, args.cantidad, args.bucle, args.semilla, repetitions=3):
+        print(f"{row['size']:<10}{row['count']:>8}{row['batched']:>16.0f}{row['looped']:>16.0f}{row['speedup']:>10.1f}")
@@ -0,0 +1,82 @@
+import gc
+import math
+import time
+import statistics
+
+###########################################################
+############MEDICIÓN DE TIEMPOS CON ESTADÍSTICAS###########
+###########################################################
+
+# Si una sola ejecución supera este tiempo (segundos) no se hace calentamiento
+# y las repeticiones se limitan a `max_total_time`.
+LONG_RUN = 1.0
+
+# Función para medir una función con calentamiento, repeticiones y estadísticas
+def benchmark(func, setup=None, repetitions=5, warmup=1, min_time=0.02, max_loops=10000,
+              max_total_time=60.0, disable_gc=True):
+    """Mide `func(*setup())` con `time.perf_counter_ns` y retorna (resultado, estadísticas).
+
+    - `setup` prepara los argumentos de cada llamada y queda fuera de la medición
+      (por ejemplo, una copia nueva del arreglo a ordenar).
+    - Los casos rápidos se repiten `loops` veces por muestra hasta durar al menos `min_time`.
+    - Los casos lentos (más de LONG_RUN segundos) usan la primera ejecución como muestra
+      y solo se repiten mientras quepan en `max_total_time`.
+    """
+    setup = setup or (lambda: ())
+
+    # Primera ejecución: calibración
+    result, first = _timed_run(func, [setup()], disable_gc)
+
+    if first >= LONG_RUN:
+        samples = [first]
+        remaining = min(repetitions - 1, int(max_total_time / first) - 1)
+        for _ in range(max(0, remaining)):
+            result, elapsed = _timed_run(func, [setup()], disable_gc)
+            samples.append(elapsed)
+        loops = 1
+    else:
+        loops = 1 if first >= min_time else min(max_loops, math.ceil(min_time / max(first, 1e-9)))
+        for _ in range(warmup):
+            result, _ = _timed_run(func, [setup()], disable_gc)
+        samples = []
+        for _ in range(repetitions):
+            result, elapsed = _timed_run(func, [setup() for _ in range(loops)], disable_gc)
+            samples.append(elapsed / loops)
+
+    return result, summarize(samples, loops)
+
+def _timed_run(func, calls, disable_gc):
+    """Ejecuta `func` una vez por cada juego de argumentos y retorna (último resultado, segundos)."""
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for args in calls:
+            result = func(*args)
+        end = time.perf_counter_ns()
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+    return result, (end - start) / 1e9
+
+# Función para resumir las muestras de tiempo
+def summarize(samples, loops=1):
+    """Retorna min/mediana/p95/media/desviación estándar (en segundos) de las muestras."""
+    ordered = sorted(samples)
+    p95_index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[p95_index],
+        "mean": statistics.fmean(ordered),
+        "stddev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "repetitions": len(ordered),
+        "loops": loops,
+    }
+
+def format_stats(stats):
+    """Línea de texto con las estadísticas, para los archivos de resultados."""
+    return (f"min: {stats['min']} mediana: {stats['median']} p95: {stats['p95']} "
+            f"desviación estándar: {stats['stddev']} ({stats['repetitions']} repeticiones x {stats['loops']} ciclos)")
@@ -0,0 +1,70 @@
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+###########################################################
+######POOL DE PROCESOS SOBRE MEMORIA COMPARTIDA############
+###########################################################
+
+# Funciones para compartir arreglos entre procesos sin serializarlos
+def create_shared(shape, dtype=np.int64):
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize))
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return shm, array, {"name": shm.name, "shape": tuple(shape), "dtype": np.dtype(dtype).str}
+
+def attach_shared(desc):
+    shm = shared_memory.SharedMemory(name=desc["name"])
+    return shm, np.ndarray(desc["shape"], dtype=desc["dtype"], buffer=shm.buf)
+
+# Estado de cada proceso trabajador (se llena una vez en el initializer); los trabajos leen
+# worker["arrays"] y los valores que pasó el proceso principal (algoritmo, parámetros, ...)
+worker = {}
+
+def _init_worker(descs, state):
+    worker.update(state)
+    worker["handles"] = []
+    worker["arrays"] = {}
+    for key, desc in descs.items():
+        shm, array = attach_shared(desc)
+        worker["handles"].append(shm)  # Mantener la referencia para que el buffer siga válido
+        worker["arrays"][key] = array
+
+def _worker_ready(_):
+    return os.getpid()
+
+# Base de los ejecutores paralelos: el pool y la memoria compartida se crean una vez y se reutilizan
+class SharedMemoryPool:
+    """Arreglos en multiprocessing.shared_memory (`_share`) y un pool de procesos que los abre una
+    sola vez (`_start_pool`); `close` (o el bloque `with`) apaga el pool y libera la memoria."""
+
+    def __init__(self):
+        self.pool = None
+        self._handles = []
+        self._descs = {}
+
+    def _share(self, key, shape, dtype=np.int64):
+        shm, array, desc = create_shared(shape, dtype)
+        self._handles.append(shm)
+        self._descs[key] = desc
+        return array
+
+    def _start_pool(self, workers, **state):
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self._descs, state))
+        # Forzar el arranque de los procesos fuera de la medición
+        list(self.pool.map(_worker_ready, range(workers)))
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        for shm in self._handles:
+            shm.close()
+            shm.unlink()
+        self._handles = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
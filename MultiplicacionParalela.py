@@ -0,0 +1,143 @@
+import numpy as np
+import os
+import argparse
+
+from AnalisarMatrix import (MULTIPLICATION_ALGORITHMS, _pad_array, algorithm_params, crop_matrix,
+                            load_matrix_from_file, multiply_matrices, prepare_operands)
+from MedicionTiempo import benchmark
+from MemoriaCompartida import SharedMemoryPool, worker
+
+###########################################################
+######MULTIPLICACIÓN PARALELA CON MEMORIA COMPARTIDA#######
+###########################################################
+
+# Trabajos que corren en los procesos trabajadores (estado en MemoriaCompartida.worker)
+def _multiply_in_worker(X, Y):
+    algorithm = worker["algorithm"]
+    X, Y, rows, cols = prepare_operands(algorithm, X, Y)
+    return crop_matrix(multiply_matrices(algorithm, X, Y, **worker["params"]), rows, cols)
+
+def _band_job(r0, r1):
+    """Calcula las filas r0:r1 de C = A·B directamente sobre la memoria compartida."""
+    arrays = worker["arrays"]
+    arrays["C"][r0:r1] = _multiply_in_worker(arrays["A"][r0:r1], arrays["B"])
+
+def _product_job(i):
+    """Calcula el producto de Strassen M_i = TA_i · TB_i."""
+    arrays = worker["arrays"]
+    arrays[f"M{i}"][...] = _multiply_in_worker(arrays[f"TA{i}"], arrays[f"TB{i}"])
+
+# Multiplicador paralelo: el pool y la memoria compartida se crean una vez y se reutilizan
+class ParallelMultiplier(SharedMemoryPool):
+    """Multiplica A·B con `workers` procesos que leen A y B desde multiprocessing.shared_memory.
+
+    - mode="bands": C se divide en bandas de filas; cada proceso calcula una con `algorithm`.
+    - mode="strassen7": un nivel de Strassen; los siete productos M1..M7 se calculan en paralelo
+      con `algorithm` y el proceso principal combina los cuadrantes.
+    """
+
+    def __init__(self, A, B, algorithm, workers, mode="bands"):
+        if mode not in ("bands", "strassen7"):
+            raise ValueError(f"Modo paralelo desconocido: {mode}")
+        super().__init__()
+        self.algorithm = algorithm
+        self.workers = workers
+        self.mode = mode
+
+        A = np.asarray(A, dtype=np.int64)
+        B = np.asarray(B, dtype=np.int64)
+        self.rows, self.cols = A.shape[0], B.shape[1]
+
+        if mode == "bands":
+            self.A = self._share("A", A.shape)
+            self.B = self._share("B", B.shape)
+            self.C = self._share("C", (self.rows, self.cols))
+            self.A[...] = A
+            self.B[...] = B
+        else:
+            # Dimensiones pares para poder dividir en cuadrantes
+            self.A_even = _pad_array(A, 1, np.int64)
+            self.B_even = _pad_array(B, 1, np.int64)
+            hm, hp = self.A_even.shape[0] // 2, self.A_even.shape[1] // 2
+            hn = self.B_even.shape[1] // 2
+            self.TA = [self._share(f"TA{i}", (hm, hp)) for i in range(7)]
+            self.TB = [self._share(f"TB{i}", (hp, hn)) for i in range(7)]
+            self.M = [self._share(f"M{i}", (hm, hn)) for i in range(7)]
+
+        # Calibrar en el proceso principal y pasar los valores a los trabajadores
+        params = algorithm_params(algorithm)
+
+        self._start_pool(workers, algorithm=algorithm, params=params)
+
+    def multiply(self):
+        if self.mode == "bands":
+            bounds = np.linspace(0, self.rows, self.workers + 1).astype(int)
+            jobs = [self.pool.submit(_band_job, int(r0), int(r1))
+                    for r0, r1 in zip(bounds[:-1], bounds[1:]) if r1 > r0]
+            for job in jobs:
+                job.result()
+            return self.C.copy()
+        return self._multiply_strassen7()
+
+    def _multiply_strassen7(self):
+        A, B = self.A_even, self.B_even
+        hm, hp, hn = A.shape[0] // 2, A.shape[1] // 2, B.shape[1] // 2
+        A11, A12, A21, A22 = A[:hm, :hp], A[:hm, hp:], A[hm:, :hp], A[hm:, hp:]
+        B11, B12, B21, B22 = B[:hp, :hn], B[:hp, hn:], B[hp:, :hn], B[hp:, hn:]
+        TA, TB, M = self.TA, self.TB, self.M
+
+        # Operandos de M1..M7 escritos directamente en la memoria compartida
+        np.add(A11, A22, out=TA[0])
+        np.add(B11, B22, out=TB[0])
+        np.add(A21, A22, out=TA[1])
+        TB[1][...] = B11
+        TA[2][...] = A11
+        np.subtract(B12, B22, out=TB[2])
+        TA[3][...] = A22
+        np.subtract(B21, B11, out=TB[3])
+        np.add(A11, A12, out=TA[4])
+        TB[4][...] = B22
+        np.subtract(A21, A11, out=TA[5])
+        np.add(B11, B12, out=TB[5])
+        np.subtract(A12, A22, out=TA[6])
+        np.add(B21, B22, out=TB[6])
+
+        for job in [self.pool.submit(_product_job, i) for i in range(7)]:
+            job.result()
+
+        C = np.empty((2 * hm, 2 * hn), dtype=np.int64)
+        C[:hm, :hn] = M[0] + M[3] - M[4] + M[6]
+        C[:hm, hn:] = M[2] + M[4]
+        C[hm:, :hn] = M[1] + M[3]
+        C[hm:, hn:] = M[0] - M[1] + M[2] + M[5]
+        return C[:self.rows, :self.cols]
+
+# Función para medir la escalabilidad de 1 a N procesos
+def scaling_report(A, B, algorithm, max_workers=None, mode="bands", **timing_options):
+    """Retorna una fila por número de procesos con tiempo, speedup (T1/Tp) y eficiencia (speedup/p)."""
+    max_workers = max_workers or os.cpu_count() or 1
+    rows = []
+    base = None
+    for workers in range(1, max_workers + 1):
+        with ParallelMultiplier(A, B, algorithm, workers, mode) as multiplier:
+            _, stats = benchmark(multiplier.multiply, **timing_options)
+        base = base or stats["median"]
+        speedup = base / stats["median"]
+        rows.append({"algorithm": algorithm, "mode": mode, "workers": workers, "time": stats["median"],
+                     "speedup": speedup, "efficiency": speedup / workers})
+    return rows
+
+# Ejecutar el reporte de escalabilidad sobre un par de matrices de GenerarMatrix
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Escalabilidad de la multiplicación paralela.")
+    parser.add_argument("--algoritmo", default="blocked", choices=MULTIPLICATION_ALGORITHMS)
+    parser.add_argument("--modo", default="bands", choices=["bands", "strassen7"])
+    parser.add_argument("--trabajadores", type=int, default=None, help="máximo de procesos")
+    parser.add_argument("--tamano", default="1000x1000", help="tamaño de las matrices cuadradas en matrix_datasets")
+    args = parser.parse_args()
+
+    A = load_matrix_from_file(f"matrix_datasets/square_matrix_1_{args.tamano}.txt")
+    B = load_matrix_from_file(f"matrix_datasets/square_matrix_2_{args.tamano}.txt")
+    print(f"{'procesos':>9}{'tiempo (s)':>14}{'speedup':>10}{'eficiencia':>12}")
+    for row in scaling_report(A, B, args.algoritmo, args.trabajadores, args.modo, repetitions=3):
+        print(f"{row['workers']:>9}{row['time']:>14.4f}{row['speedup']:>10.2f}{row['efficiency']:>12.2f}")
@@ -0,0 +1,139 @@
+import numpy as np
+import os
+import time
+import heapq
+import shutil
+import argparse
+import tempfile
+
+from AnalisarArreglos import sort_array
+from FormatoBinario import BINARY_EXTENSION, create_binary, dataset_kind, load_array
+
+###########################################################
+##########ORDENAMIENTO EXTERNO (FUERA DE MEMORIA)##########
+###########################################################
+
+# Memoria aproximada por elemento de una lista de Python mientras se ordena
+# (puntero + objeto int + copias auxiliares de algoritmos como merge_sort)
+BYTES_PER_ELEMENT = 64
+RUN_DTYPE = np.int64
+
+# Función para ordenar un dataset que no cabe en memoria
+def external_sort(input_path, output_path, algorithm="sorted_builtin", memory_budget=256 * 2**20,
+                  io_block=1 << 16, temp_dir=None):
+    """Ordena `input_path` con memoria acotada por `memory_budget` (bytes).
+
+    1. Lee el dataset por bloques desde el memmap binario y ordena cada bloque con `algorithm`.
+    2. Escribe cada bloque ordenado (corrida) en un archivo temporal.
+    3. Mezcla las corridas con un heap (k vías), en varias pasadas si son demasiadas.
+    4. Escribe el resultado en streaming (texto, o binario si `output_path` termina en .bin).
+    """
+    start_time = time.time()
+    data = load_array(input_path)
+    n = data.shape[0]
+
+    chunk_elements = max(1, memory_budget // BYTES_PER_ELEMENT)
+    # Cada corrida abierta durante la mezcla mantiene un bloque en memoria
+    io_block = max(1, min(io_block, memory_budget // (BYTES_PER_ELEMENT * 3)))
+    fan_in = max(2, memory_budget // (io_block * BYTES_PER_ELEMENT) - 1)
+
+    work_dir = tempfile.mkdtemp(prefix="ordenamiento_externo_", dir=temp_dir)
+    try:
+        # Fase 1: generar corridas ordenadas
+        runs = []
+        for start in range(0, n, chunk_elements):
+            chunk = data[start:start + chunk_elements].tolist()
+            chunk = sort_array(algorithm, chunk)
+            run_path = os.path.join(work_dir, f"corrida_{len(runs)}.run")
+            np.asarray(chunk, dtype=RUN_DTYPE).tofile(run_path)
+            runs.append(run_path)
+            del chunk
+
+        # Fase 2: mezclar en grupos de `fan_in` hasta que quede una sola pasada
+        passes = 0
+        while len(runs) > fan_in:
+            merged_runs = []
+            for g in range(0, len(runs), fan_in):
+                group = runs[g:g + fan_in]
+                run_path = os.path.join(work_dir, f"mezcla_{passes}_{len(merged_runs)}.run")
+                with open(run_path, 'wb') as f:
+                    for block in _merge_blocks(group, io_block):
+                        np.asarray(block, dtype=RUN_DTYPE).tofile(f)
+                for path in group:
+                    os.remove(path)
+                merged_runs.append(run_path)
+            runs = merged_runs
+            passes += 1
+
+        # Fase 3: última mezcla escrita directamente en el archivo de salida
+        _write_output(_merge_blocks(runs, io_block), output_path, n, dataset_kind(input_path))
+        passes += 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {"size": n, "chunks": -(-n // chunk_elements), "merge_passes": passes,
+            "elapsed_time": time.time() - start_time}
+
+# Funciones auxiliares para la mezcla de corridas
+def _read_run(path, io_block):
+    """Itera los valores de una corrida leyendo `io_block` elementos a la vez."""
+    with open(path, 'rb') as f:
+        while True:
+            block = np.fromfile(f, dtype=RUN_DTYPE, count=io_block)
+            if block.size == 0:
+                return
+            yield from block.tolist()
+
+def _merge_blocks(run_paths, io_block):
+    """Mezcla k corridas con heapq y entrega el resultado en bloques de `io_block` valores."""
+    merged = heapq.merge(*(_read_run(path, io_block) for path in run_paths))
+    block = []
+    for value in merged:
+        block.append(value)
+        if len(block) == io_block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+def _write_output(blocks, output_path, n, kind):
+    folder = os.path.dirname(output_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    if output_path.endswith(BINARY_EXTENSION):
+        out = create_binary(output_path, (n,), RUN_DTYPE, kind)
+        pos = 0
+        for block in blocks:
+            out[pos:pos + len(block)] = block
+            pos += len(block)
+        out.flush()
+        del out
+        return
+
+    # Mismo formato que save_sorted_array: valores separados por espacio y salto de línea final
+    with open(output_path, 'w') as f:
+        first = True
+        for block in blocks:
+            if not first:
+                f.write(' ')
+            f.write(' '.join(map(str, block)))
+            first = False
+        f.write('\n')
+
+# Ejecutar el ordenamiento externo desde la línea de comandos
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ordenamiento externo con memoria acotada.")
+    parser.add_argument("entrada", help="dataset a ordenar (.txt o .bin)")
+    parser.add_argument("salida", help="archivo de salida (.txt o .bin)")
+    parser.add_argument("--algoritmo", default="sorted_builtin",
+                        help="algoritmo de AnalisarArreglos para ordenar cada bloque")
+    parser.add_argument("--memoria", type=int, default=256,
+                        help="presupuesto de memoria en MiB")
+    parser.add_argument("--temporal", default=None, help="carpeta para las corridas temporales")
+    args = parser.parse_args()
+
+    stats = external_sort(args.entrada, args.salida, args.algoritmo, args.memoria * 2**20,
+                          temp_dir=args.temporal)
+    print(f"Ordenados {stats['size']} elementos en {stats['chunks']} bloques "
+          f"({stats['merge_passes']} pasadas de mezcla): {stats['elapsed_time']:.2f} segundos")
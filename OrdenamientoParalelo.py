@@ -0,0 +1,165 @@
+import numpy as np
+import os
+import argparse
+
+from AnalisarArreglos import measure_sorting_time, sort_array
+from FormatoBinario import smallest_int_dtype
+from GenerarArreglos import (generate_partially_ordered_array, generate_random_array, generate_reverse_ordered_array,
+                             generate_semi_ordered_array, generate_sorted_array)
+from MedicionTiempo import benchmark
+from MemoriaCompartida import SharedMemoryPool, worker
+
+###########################################################
+######ORDENAMIENTO PARALELO MULTIVÍA (TIPO SAMPLE SORT)####
+###########################################################
+
+# Trabajos que corren en los procesos trabajadores (estado en MemoriaCompartida.worker)
+def _sort_chunk_job(lo, hi):
+    """Fase 1: copia input[lo:hi] al buffer de trabajo y lo ordena ahí con el algoritmo elegido."""
+    arrays = worker["arrays"]
+    chunk = arrays["work"][lo:hi]
+    chunk[...] = arrays["input"][lo:hi]
+    result = sort_array(worker["algorithm"], chunk)
+    if result is not chunk:
+        chunk[...] = result  # Algoritmos que retornan un arreglo nuevo (quick_sort, sorted, ...)
+
+def _merge_job(segments, out_lo, out_hi):
+    """Fase 3: mezcla los tramos ordenados `segments` (uno por bloque) en output[out_lo:out_hi].
+
+    Los tramos se copian en orden de bloque y se mezclan con el sort estable de NumPy, que detecta
+    las corridas (timsort) o usa radix para enteros pequeños; los iguales conservan el orden de bloque.
+    """
+    arrays = worker["arrays"]
+    out = arrays["output"][out_lo:out_hi]
+    position = 0
+    for lo, hi in segments:
+        out[position:position + hi - lo] = arrays["work"][lo:hi]
+        position += hi - lo
+    out.sort(kind='stable')
+
+# Función para elegir los separadores por rango exacto
+def split_points(chunks, ranks):
+    """Retorna, para cada rango global r de `ranks`, el corte en cada bloque ordenado de modo que
+    los cortes sumen exactamente r (selección multisecuencia).
+
+    El separador es el menor valor v con al menos r elementos <= v; los elementos iguales a v se
+    reparten entre los bloques en orden, así las particiones quedan balanceadas aunque haya muchas
+    claves repetidas (por ejemplo, valores entre 0 y 100 en 10^8 elementos).
+    """
+    non_empty = [c for c in chunks if len(c)]
+    lo_value = min(int(c[0]) for c in non_empty) if non_empty else 0
+    hi_value = max(int(c[-1]) for c in non_empty) if non_empty else 0
+    cuts = []
+    for rank in ranks:
+        lo, hi = lo_value, hi_value
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if sum(int(np.searchsorted(c, mid, side='right')) for c in chunks) >= rank:
+                hi = mid
+            else:
+                lo = mid + 1
+        left = [int(np.searchsorted(c, lo, side='left')) for c in chunks]
+        right = [int(np.searchsorted(c, lo, side='right')) for c in chunks]
+        need = rank - sum(left)
+        cut = []
+        for l, r in zip(left, right):
+            take = min(need, r - l)
+            cut.append(l + take)
+            need -= take
+        cuts.append(cut)
+    return cuts
+
+# Ordenador paralelo: el pool y la memoria compartida se crean una vez y se reutilizan
+class ParallelSorter(SharedMemoryPool):
+    """Ordena `arr` con `workers` procesos sobre multiprocessing.shared_memory, con la estructura de merge sort:
+
+    1. Divide el arreglo en `workers` bloques y los ordena en paralelo con `algorithm`.
+    2. Elige separadores por rango (split_points) para partir todos los bloques en `workers` tramos.
+    3. Cada proceso mezcla su tramo de todos los bloques en su parte de la salida (k vías).
+    """
+
+    def __init__(self, arr, algorithm="numpy_stable", workers=None):
+        super().__init__()
+        self.algorithm = algorithm
+        self.workers = workers or os.cpu_count() or 1
+
+        if not isinstance(arr, np.ndarray):
+            arr = np.asarray(arr)
+            if arr.size:
+                arr = arr.astype(smallest_int_dtype(int(arr.min()), int(arr.max())))
+        self.n = len(arr)
+        self.input = self._share("input", arr.shape, arr.dtype)
+        self.work = self._share("work", arr.shape, arr.dtype)
+        self.output = self._share("output", arr.shape, arr.dtype)
+        self.input[...] = arr
+        self.bounds = [int(b) for b in np.linspace(0, self.n, self.workers + 1)]
+
+        self._start_pool(self.workers, algorithm=algorithm)
+
+    def sort(self):
+        """Retorna una copia ordenada del arreglo (la entrada compartida no se modifica)."""
+        bounds = self.bounds
+        jobs = [self.pool.submit(_sort_chunk_job, lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        for job in jobs:
+            job.result()
+
+        chunks = [self.work[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+        cuts = [[0] * len(chunks)] + split_points(chunks, bounds[1:-1]) + [[len(c) for c in chunks]]
+        jobs = []
+        for q in range(self.workers):
+            segments = [(lo + cuts[q][i], lo + cuts[q + 1][i]) for i, lo in enumerate(bounds[:-1])
+                        if cuts[q + 1][i] > cuts[q][i]]
+            if bounds[q + 1] > bounds[q]:
+                jobs.append(self.pool.submit(_merge_job, segments, bounds[q], bounds[q + 1]))
+        for job in jobs:
+            job.result()
+        return self.output.copy()
+
+# Función para ordenar una vez en paralelo (crea y cierra el pool)
+def parallel_sort(arr, algorithm="numpy_stable", workers=None):
+    with ParallelSorter(arr, algorithm, workers) as sorter:
+        return sorter.sort()
+
+# Familias de datasets_a para el reporte
+SPEEDUP_FAMILIES = {
+    "random": generate_random_array,
+    "semi_ordered": generate_semi_ordered_array,
+    "partially_ordered": generate_partially_ordered_array,
+    "reverse_ordered": generate_reverse_ordered_array,
+    "sorted": generate_sorted_array,
+}
+
+# Función para medir el speedup respecto de sorted() en cada familia y tamaño
+def speedup_report(sizes=(10**6, 10**7, 10**8), algorithm="numpy_stable", workers=None, seed=0, **timing_options):
+    """Retorna una fila por (familia, tamaño) con el tiempo de sorted(), el del mismo algoritmo en
+    un solo proceso y el paralelo, y los speedups respecto de cada uno."""
+    workers = workers or os.cpu_count() or 1
+    rows = []
+    for size in sizes:
+        for kind, generate in SPEEDUP_FAMILIES.items():
+            arr = generate(size, np.random.default_rng([seed, size])).astype(np.int8)
+            _, builtin = measure_sorting_time("sorted_builtin", arr, **timing_options)
+            _, serial = measure_sorting_time(algorithm, arr, **timing_options)
+            with ParallelSorter(arr, algorithm, workers) as sorter:
+                result, parallel = benchmark(sorter.sort, **timing_options)
+            if not np.array_equal(result, np.sort(arr)):
+                raise AssertionError(f"El ordenamiento paralelo falló en {kind}_{size}")
+            rows.append({"data_type": kind, "size": size, "workers": workers, "sorted": builtin["median"],
+                         "serial": serial["median"], "parallel": parallel["median"],
+                         "speedup_sorted": builtin["median"] / parallel["median"],
+                         "speedup_serial": serial["median"] / parallel["median"]})
+    return rows
+
+# Ejecutar el reporte de speedup sobre las cinco familias de datasets_a
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Speedup del ordenamiento paralelo respecto de sorted().")
+    parser.add_argument("--algoritmo", default="numpy_stable", help="algoritmo de AnalisarArreglos para cada bloque")
+    parser.add_argument("--trabajadores", type=int, default=None, help="número de procesos")
+    parser.add_argument("--tamanos", type=lambda s: int(float(s)), nargs="+", default=[10**6, 10**7, 10**8])
+    args = parser.parse_args()
+
+    print(f"{'dataset':<20}{'tamaño':>12}{'sorted (s)':>12}{'serial (s)':>12}{'paralelo (s)':>14}"
+          f"{'vs sorted':>11}{'vs serial':>11}")
+    for row in speedup_report(args.tamanos, args.algoritmo, args.trabajadores, repetitions=3):
+        print(f"{row['data_type']:<20}{row['size']:>12}{row['sorted']:>12.4f}{row['serial']:>12.4f}"
+              f"{row['parallel']:>14.4f}{row['speedup_sorted']:>11.2f}{row['speedup_serial']:>11.2f}")
@@ -0,0 +1,265 @@
+import numpy as np
+import os
+import json
+import math
+import operator
+import logging
+import argparse
+
+from AlmacenResultados import DEFAULT_DB, load_results, record_results
+from FormatoBinario import dataset_kind, list_datasets, load_typed_array
+
+###########################################################
+#######SELECCIÓN AUTOMÁTICA DEL ALGORITMO DE ORDENAMIENTO##
+###########################################################
+
+logger = logging.getLogger(__name__)
+
+# Umbrales calibrados (se generan con `python SeleccionAlgoritmo.py --calibrar`)
+THRESHOLDS_FILE = "umbrales_ordenamiento.json"
+DEFAULT_THRESHOLDS = {
+    "native_min_size": 64,             # Desde este tamaño, un np.ndarray se ordena con el sort estable de NumPy
+    "insertion_max_size": 16,          # Hasta este tamaño, inserción
+    "counting_min_size": 64,           # Desde este tamaño, conteo/radix para claves enteras...
+    "counting_max_span": 1 << 20,      # ...si el rango de claves no supera este valor
+    "presorted_max_run_ratio": 0.1,    # Corridas por elemento bajo las que conviene el merge adaptativo
+}
+# Algoritmos entre los que elige el despachador (numpy_stable solo para buffers tipados)
+CANDIDATES = ["insertion_sort", "adaptive_merge_sort", "counting_sort", "intro_sort"]
+NATIVE = "numpy_stable"
+SAMPLE_SIZE = 1024
+
+_thresholds = {}
+
+# Funciones para leer y guardar los umbrales
+def load_thresholds(path=THRESHOLDS_FILE):
+    """Umbrales del archivo `path` (se lee una vez por proceso); si no existe, los por defecto."""
+    if path not in _thresholds:
+        thresholds = dict(DEFAULT_THRESHOLDS)
+        if os.path.exists(path):
+            with open(path) as f:
+                thresholds.update(json.load(f))
+        _thresholds[path] = thresholds
+    return _thresholds[path]
+
+def save_thresholds(thresholds, path=THRESHOLDS_FILE):
+    with open(path, 'w') as f:
+        json.dump(thresholds, f, indent=2, sort_keys=True)
+        f.write('\n')
+    _thresholds[path] = dict(DEFAULT_THRESHOLDS, **thresholds)
+
+# Función para describir el arreglo con una muestra barata
+def sample_features(arr, sample_size=SAMPLE_SIZE):
+    """Retorna tamaño, rango de claves y presortedness estimada con a lo sumo `sample_size` pares.
+
+    - run_ratio: min(fracción de pares vecinos que bajan, fracción que suben); ~0 si el arreglo está
+      casi ordenado en cualquiera de los dos sentidos (pocas corridas), ~0.5 si es aleatorio.
+    - inversion_ratio: fracción de pares (i, i + n/2) invertidos (0 ordenado, ~0.5 aleatorio, 1 inverso).
+    Los pares se toman con paso fijo (sin generador aleatorio) y el rango (min/max) se calcula sobre
+    todo el arreglo, en C o NumPy, solo si las claves son enteras.
+    """
+    n = len(arr)
+    features = {"size": n, "integer_keys": False, "span": None, "run_ratio": 0.0, "inversion_ratio": 0.0}
+    if n < 2:
+        return features
+
+    pairs = min(sample_size, n - 1)
+    step = (n - 1) // pairs
+    gap = n // 2
+    far = min(sample_size, n - gap)
+    far_step = (n - gap) // far
+    a, b = arr[0:step * pairs:step], arr[1:step * pairs + 1:step]
+    c, d = arr[0:far_step * far:far_step], arr[gap:gap + far_step * far:far_step]
+    if isinstance(arr, np.ndarray):
+        features["integer_keys"] = arr.dtype.kind in "iub"
+        descents, ascents = int(np.count_nonzero(a > b)), int(np.count_nonzero(a < b))
+        inversions = int(np.count_nonzero(c > d))
+        if features["integer_keys"]:
+            features["span"] = int(arr.max()) - int(arr.min()) + 1
+    else:
+        features["integer_keys"] = all(isinstance(x, int) for x in a[:32])
+        descents = sum(map(operator.gt, a, b))
+        ascents = sum(map(operator.lt, a, b))
+        inversions = sum(map(operator.gt, c, d))
+        if features["integer_keys"]:
+            features["span"] = max(arr) - min(arr) + 1
+    features["run_ratio"] = min(descents, ascents) / pairs
+    features["inversion_ratio"] = inversions / far
+    return features
+
+# Funciones que deciden el algoritmo
+def dispatch_decision(arr, thresholds=None):
+    """Retorna {"algorithm", "reason", "features"} para `arr`; `features` es None si no hizo falta muestrear.
+
+    El tamaño se consulta primero: los arreglos pequeños (y los buffers tipados grandes) se
+    despachan sin muestrear.
+    """
+    thresholds = thresholds or load_thresholds()
+    n = len(arr)
+    features = None
+    if isinstance(arr, np.ndarray) and n >= thresholds["native_min_size"]:
+        algorithm, reason = NATIVE, f"buffer tipado con n >= {thresholds['native_min_size']}"
+    elif n <= thresholds["insertion_max_size"]:
+        algorithm, reason = "insertion_sort", f"n <= {thresholds['insertion_max_size']}"
+    else:
+        features = sample_features(arr)
+        if (features["integer_keys"] and n >= thresholds["counting_min_size"]
+                and features["span"] <= thresholds["counting_max_span"]):
+            algorithm, reason = "counting_sort", f"claves enteras con rango {features['span']}"
+        elif features["run_ratio"] <= thresholds["presorted_max_run_ratio"]:
+            algorithm, reason = "adaptive_merge_sort", f"run_ratio {features['run_ratio']:.3f} (casi ordenado)"
+        else:
+            algorithm, reason = "intro_sort", "caso general"
+    return {"algorithm": algorithm, "reason": reason, "size": n, "features": features}
+
+def choose_algorithm(arr, thresholds=None):
+    """Retorna el nombre del algoritmo para `arr` (ver dispatch_decision).
+
+    Se llama en cada repetición medida, así que cada decisión va al log solo en nivel DEBUG;
+    measure_sorting_time registra una por medición en nivel INFO y la guarda en stats["dispatch"].
+    """
+    decision = dispatch_decision(arr, thresholds)
+    if logger.isEnabledFor(logging.DEBUG):
+        log_decision(decision, logging.DEBUG)
+    return decision["algorithm"]
+
+def log_decision(decision, level=logging.INFO):
+    features = decision["features"]
+    if features is None:
+        logger.log(level, "auto_sort: n=%d -> %s (%s)", decision["size"], decision["algorithm"], decision["reason"])
+    else:
+        logger.log(level, "auto_sort: n=%d rango=%s run_ratio=%.3f inversion_ratio=%.3f -> %s (%s)",
+                   decision["size"], features["span"], features["run_ratio"], features["inversion_ratio"],
+                   decision["algorithm"], decision["reason"])
+
+# Funciones para calibrar los umbrales con los datasets
+def derive_thresholds(records):
+    """Calcula los umbrales a partir de registros con `features` y tiempo de cada candidato por dataset.
+
+    Cada umbral se ubica entre el último dataset donde un algoritmo ganó y el primero donde perdió
+    (media geométrica para tamaños, punto medio para run_ratio).
+    """
+    cases = {}
+    for r in records:
+        case = cases.setdefault((r["data_type"], int(r["size"])), {"features": r["features"], "times": {}})
+        case["times"][r["algorithm"]] = r["time"]
+    thresholds = dict(DEFAULT_THRESHOLDS)
+
+    def winner(times, among=CANDIDATES):
+        present = {a: t for a, t in times.items() if a in among}
+        return min(present, key=present.get) if present else None
+
+    def size_threshold(algorithm, among, below):
+        """Umbral de tamaño donde `algorithm` gana en todos los datasets de ese tamaño: si `below`, el
+        mayor tamaño de ese tipo (sin pasar el primero en que pierde); si no, el menor."""
+        by_size = {}
+        for c in cases.values():
+            if algorithm in c["times"]:
+                won = winner(c["times"], among) == algorithm
+                by_size[c["features"]["size"]] = by_size.get(c["features"]["size"], True) and won
+        if not by_size:
+            return None
+        sizes = sorted(by_size, reverse=not below)
+        edge = None
+        for n in sizes:
+            if not by_size[n]:
+                return edge if edge is None else int(math.sqrt(edge * n))
+            edge = n
+        return edge
+
+    # Buffers tipados: desde el menor tamaño en que el sort estable de NumPy gana en todos los datasets
+    native = size_threshold(NATIVE, CANDIDATES + [NATIVE], below=False)
+    if native is not None:
+        thresholds["native_min_size"] = native
+    elif any(NATIVE in c["times"] for c in cases.values()):
+        thresholds["native_min_size"] = max(c["features"]["size"] for c in cases.values()) + 1
+
+    # Inserción: hasta el mayor tamaño en que gana en todos los datasets
+    insertion = size_threshold("insertion_sort", CANDIDATES, below=True)
+    if any("insertion_sort" in c["times"] for c in cases.values()):
+        thresholds["insertion_max_size"] = insertion or 1
+
+    # Conteo: desde el menor tamaño en que gana a los algoritmos por comparación, hasta el mayor rango en que gana
+    rest = [a for a in CANDIDATES if a != "insertion_sort"]
+    counting = [c for c in cases.values() if c["features"]["integer_keys"] and "counting_sort" in c["times"]]
+    counting_wins = [c["features"] for c in counting if winner(c["times"], rest) == "counting_sort"]
+    if counting:
+        if counting_wins:
+            first = min(f["size"] for f in counting_wins)
+            losses = [c["features"]["size"] for c in counting
+                      if winner(c["times"], rest) != "counting_sort" and c["features"]["size"] < first]
+            thresholds["counting_min_size"] = int(math.sqrt(first * max(losses))) if losses else first
+            thresholds["counting_max_span"] = max(f["span"] for f in counting_wins)
+        else:
+            thresholds["counting_min_size"] = max(c["features"]["size"] for c in counting) + 1
+
+    # Merge adaptativo contra introsort según la presortedness
+    merge_ratios, intro_ratios = [], []
+    for c in cases.values():
+        pick = winner(c["times"], ["adaptive_merge_sort", "intro_sort"])
+        if pick == "adaptive_merge_sort":
+            merge_ratios.append(c["features"]["run_ratio"])
+        elif pick == "intro_sort":
+            intro_ratios.append(c["features"]["run_ratio"])
+    if merge_ratios and intro_ratios:
+        below = [r for r in merge_ratios if r < min(intro_ratios)]
+        low = max(below) if below else 0.0
+        thresholds["presorted_max_run_ratio"] = (low + min(intro_ratios)) / 2
+    elif merge_ratios:
+        thresholds["presorted_max_run_ratio"] = max(merge_ratios)
+    return thresholds
+
+def calibrate(folder="datasets_a", db_path=DEFAULT_DB, path=THRESHOLDS_FILE, max_insertion_size=1000,
+              **timing_options):
+    """Mide los candidatos (y numpy_stable) en cada dataset de `folder`, guarda los tiempos en el almacén de resultados,
+    deriva los umbrales y los escribe en `path`. Inserción solo se mide hasta `max_insertion_size`."""
+    from AnalisarArreglos import measure_sorting_time
+
+    records = []
+    for filename in list_datasets(folder):
+        data = load_typed_array(os.path.join(folder, filename))
+        features = sample_features(data)
+        for algorithm in CANDIDATES + [NATIVE]:
+            if algorithm == "insertion_sort" and len(data) > max_insertion_size:
+                continue
+            _, stats = measure_sorting_time(algorithm, data, **timing_options)
+            records.append({"algorithm": algorithm, "data_type": dataset_kind(filename), "size": len(data),
+                            "time": stats["median"], **stats, "features": features})
+    record_results(records, "sort", db_path)
+    thresholds = derive_thresholds(records)
+    save_thresholds(thresholds, path)
+    return thresholds
+
+# Función para comparar el despachador con cada algoritmo fijo
+def compare_with_fixed(db_path=DEFAULT_DB):
+    """Suma el tiempo de auto_sort y de cada algoritmo fijo sobre los datasets que ambos midieron
+    (ejecución más reciente de cada uno). `ratio` < 1 significa que auto_sort fue más rápido."""
+    latest = load_results(db_path, suite="sort", latest_only=True)
+    auto = {(r["data_type"], r["size"]): r["median"] for r in latest if r["algorithm"] == "auto_sort"}
+    totals = {}
+    for r in latest:
+        key = (r["data_type"], r["size"])
+        if r["algorithm"] == "auto_sort" or key not in auto:
+            continue
+        total = totals.setdefault(r["algorithm"], {"algorithm": r["algorithm"], "datasets": 0, "auto": 0.0, "fixed": 0.0})
+        total["datasets"] += 1
+        total["auto"] += auto[key]
+        total["fixed"] += r["median"]
+    for total in totals.values():
+        total["ratio"] = total["auto"] / total["fixed"] if total["fixed"] else float("inf")
+    return sorted(totals.values(), key=lambda t: t["ratio"])
+
+# Calibrar los umbrales y mostrar la comparación con los algoritmos fijos
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibra y evalúa la selección automática del ordenamiento.")
+    parser.add_argument("--calibrar", action="store_true", help="medir los candidatos y recalcular los umbrales")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.calibrar:
+        print(json.dumps(calibrate(repetitions=3), indent=2))
+
+    print(f"{'algoritmo':<22}{'datasets':>10}{'auto (s)':>14}{'fijo (s)':>14}{'auto/fijo':>12}")
+    for total in compare_with_fixed():
+        print(f"{total['algorithm']:<22}{total['datasets']:>10}{total['auto']:>14.4f}"
+              f"{total['fixed']:>14.4f}{total['ratio']:>12.3f}")
@@ -0,0 +1,330 @@
+import numpy as np
+import os
+import sys
+import json
+import fnmatch
+import logging
+import argparse
+import statistics
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from AlmacenResultados import git_revision, machine_info
+from AnalisarArreglos import SORTING_FUNCTIONS, measure_sorting_time, sort_array
+from AnalisarMatrix import (MULTIPLICATION_ALGORITHMS, algorithm_params, measure_multiplication_time,
+                            multiply_matrices, prepare_operands, strassen_threshold, tuned_block_size)
+from FormatoBinario import smallest_int_dtype
+from GenerarArreglos import DISTRIBUTIONS, dataset_seed
+from GenerarMatrix import MATRIX_SHAPES, generate_rectangular_matrix, matrix_seed
+
+###########################################################
+######SUITE DE REGRESIÓN DE RENDIMIENTO CON PRESUPUESTOS###
+###########################################################
+
+# La base se crea una vez en la máquina de referencia con `python SuiteRendimiento.py --actualizar-base`
+# y se versiona junto al código; sin base (o con otra semilla) la suite termina con código 2 y no
+# mide nada, salvo con --solo-presupuestos, que revisa solo los presupuestos absolutos.
+BASELINE_FILE = "base_rendimiento.json"
+BUDGETS_FILE = "presupuestos_rendimiento.json"
+REPORT_FILE = "reporte_rendimiento.txt"
+
+# Subconjunto fijo de datasets (se generan con la semilla, no se leen de datasets_a)
+SORT_KINDS = ["random", "sorted", "reverse_ordered", "few_unique", "large_range"]
+SORT_SIZES = [100, 1000]
+SLOW_SORTS = {"bubble_sort": 1000, "insertion_sort": 1000}  # Tamaño máximo de los algoritmos cuadráticos
+MATRIX_SIZES = [16, 64]
+
+# Tolerancias: un caso es regresión si incluso su muestra más rápida supera la mediana de la base en
+# más de `tolerance` (relativo) más `noise_factor` veces el ruido de la base (p95 - mediana). El ruido
+# de la ejecución actual no cuenta: una regresión que además agrega varianza no amplía su propio
+# límite. Los casos sospechosos se vuelven a medir `RETRIES` veces
+TOLERANCE = 0.25
+NOISE_FACTOR = 3.0
+MIN_TIME_DELTA = 5e-6          # Diferencias menores (segundos) se consideran ruido del reloj
+MEMORY_TOLERANCE = 0.10
+MIN_MEMORY_DELTA = 4096        # Bytes
+RETRIES = 2
+
+# Presupuestos por patrón de caso (fnmatch sobre "suite/algoritmo/dataset"); el archivo BUDGETS_FILE los amplía
+DEFAULT_BUDGETS = {
+    "*": {"time": 2.0, "memory": 64 << 20},
+}
+
+# Funciones para generar los casos de la suite
+def sorting_cases(seed=0):
+    """Retorna (id, suite, algoritmo, operandos) para cada algoritmo de AnalisarArreglos y dataset del subconjunto."""
+    cases = []
+    for kind in SORT_KINDS:
+        for size in SORT_SIZES:
+            rng = np.random.default_rng(dataset_seed(seed, kind, size))
+            arr = np.concatenate(list(DISTRIBUTIONS[kind](size, rng)))
+            arr = arr.astype(smallest_int_dtype(int(arr.min()), int(arr.max())))
+            for algorithm in SORTING_FUNCTIONS:
+                if size <= SLOW_SORTS.get(algorithm, size):
+                    cases.append((f"sort/{algorithm}/{kind}_{size}", "sort", algorithm, (arr,)))
+    return cases
+
+def matrix_cases(seed=0):
+    """Retorna (id, suite, algoritmo, operandos) para cada algoritmo de AnalisarMatrix y par del subconjunto."""
+    cases = []
+    for size in MATRIX_SIZES:
+        for kind in ("square", "rectangular"):
+            A_name, B_name = f"{kind}_matrix_1", f"{kind}_matrix_2"
+            A = generate_rectangular_matrix(*MATRIX_SHAPES[A_name](size),
+                                            np.random.default_rng(matrix_seed(seed, A_name, size)))
+            B = generate_rectangular_matrix(*MATRIX_SHAPES[B_name](size),
+                                            np.random.default_rng(matrix_seed(seed, B_name, size)))
+            for algorithm in MULTIPLICATION_ALGORITHMS:
+                cases.append((f"matrix/{algorithm}/{kind}_{A.shape[0]}x{A.shape[1]}", "matrix", algorithm, (A, B)))
+    return cases
+
+# Función para medir la memoria máxima de una ejecución
+def peak_memory(func, *args):
+    """Bytes máximos asignados (Python y NumPy, según tracemalloc) durante `func(*args)`."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+# Función para medir un caso (tiempo y memoria)
+def measure_case(suite, algorithm, operands, **timing_options):
+    if suite == "sort":
+        arr, = operands
+        _, stats = measure_sorting_time(algorithm, arr, **timing_options)
+        peak = peak_memory(lambda data: sort_array(algorithm, data), arr.copy())
+    else:
+        _, stats = measure_multiplication_time(algorithm, *operands, **timing_options)
+        X, Y, _, _ = prepare_operands(algorithm, *operands)
+        params = algorithm_params(algorithm)
+        peak = peak_memory(lambda X, Y: multiply_matrices(algorithm, X, Y, **params), X, Y)
+    measurement = {"median": stats["median"], "p95": stats["p95"], "min": stats["min"], "stddev": stats["stddev"],
+                   "peak_bytes": peak}
+    if "dispatch" in stats:
+        measurement["dispatch"] = stats["dispatch"]  # Algoritmo que eligió auto_sort (ver SeleccionAlgoritmo)
+    return measurement
+
+# Función para ejecutar la suite completa (o los casos que coinciden con `patterns`)
+def run_suite(seed=0, patterns=None, verbose=True, **timing_options):
+    """Mide cada caso y retorna {id: mediciones}. Los umbrales calibrados se calculan antes, fuera de la medición.
+
+    `patterns` es una lista de patrones fnmatch o de ids exactos.
+    """
+    strassen_threshold()
+    tuned_block_size()
+    results = {}
+    for case_id, suite, algorithm, operands in sorting_cases(seed) + matrix_cases(seed):
+        if patterns and not any(fnmatch.fnmatchcase(case_id, p) for p in patterns):
+            continue
+        results[case_id] = measure_case(suite, algorithm, operands, **timing_options)
+        if verbose:
+            print(f"{case_id:<50}{results[case_id]['median']:>14.6f} s{results[case_id]['peak_bytes']:>14} B",
+                  file=sys.stderr)
+    return results
+
+def _configure_logging(level):
+    # Los procesos nuevos (spawn) no heredan la configuración del log del proceso principal
+    logging.basicConfig(level=level, format="%(message)s")
+
+# Función para repetir la suite en procesos nuevos
+def run_suite_processes(seed=0, patterns=None, processes=1, verbose=True, **timing_options):
+    """Ejecuta la suite en `processes` procesos nuevos (uno tras otro) y combina las mediciones.
+
+    Cada proceso tiene otra disposición de memoria y de hashes, lo que en Python puro cambia el tiempo
+    más que las repeticiones dentro de un proceso. Se combina la mediana de las medianas, el menor
+    mínimo y el mayor p95, así el ruido entre procesos queda en la tolerancia de compare.
+    """
+    if processes <= 1:
+        return run_suite(seed, patterns, verbose, **timing_options)
+    runs = []
+    for _ in range(processes):
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_configure_logging, initargs=(logging.getLogger().getEffectiveLevel(),)) as pool:
+            runs.append(pool.submit(run_suite, seed, patterns, False, **timing_options).result())
+    results = {}
+    for case_id in runs[0]:
+        samples = [run[case_id] for run in runs]
+        results[case_id] = {"median": statistics.median(m["median"] for m in samples),
+                            "p95": max(m["p95"] for m in samples), "min": min(m["min"] for m in samples),
+                            "stddev": max(m["stddev"] for m in samples),
+                            "peak_bytes": min(m["peak_bytes"] for m in samples)}
+        if "dispatch" in samples[0]:
+            results[case_id]["dispatch"] = samples[0]["dispatch"]
+        if verbose:
+            print(f"{case_id:<50}{results[case_id]['median']:>14.6f} s{results[case_id]['peak_bytes']:>14} B",
+                  file=sys.stderr)
+    return results
+
+# Funciones para leer y guardar la base y los presupuestos
+def load_baseline(path=BASELINE_FILE):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def save_baseline(results, seed, path=BASELINE_FILE):
+    baseline = {"seed": seed, "revision": git_revision(), "machine": machine_info(), "cases": results}
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return baseline
+
+def load_budgets(path=BUDGETS_FILE):
+    """Presupuestos por patrón: los de DEFAULT_BUDGETS más los del archivo (que tienen prioridad)."""
+    budgets = {pattern: dict(limits) for pattern, limits in DEFAULT_BUDGETS.items()}
+    if os.path.exists(path):
+        with open(path) as f:
+            for pattern, limits in json.load(f).items():
+                budgets.setdefault(pattern, {}).update(limits)
+    return budgets
+
+# Función para comparar una ejecución con la base y los presupuestos
+def compare(results, baseline=None, budgets=None, tolerance=TOLERANCE, noise_factor=NOISE_FACTOR):
+    """Retorna una fila por caso con la base, la medición actual, el límite permitido y el estado:
+    "ok", "mejora", "regresión" (tiempo o memoria sobre el límite ruidoso), "presupuesto"
+    (sobre un presupuesto absoluto), "nuevo" (sin base) o "sin medir" (en la base pero no ahora)."""
+    cases = (baseline or {}).get("cases", {})
+    budgets = budgets if budgets is not None else load_budgets()
+    rows = []
+    for case_id in sorted(set(results) | set(cases)):
+        current, base = results.get(case_id), cases.get(case_id)
+        row = {"case": case_id, "base": base, "current": current, "limit": None, "problems": [], "over_budget": False}
+        rows.append(row)
+        if current is None:
+            row["status"] = "sin medir"
+            continue
+
+        for pattern, limits in budgets.items():
+            if not fnmatch.fnmatch(case_id, pattern):
+                continue
+            if "time" in limits and current["median"] > limits["time"]:
+                row["problems"].append(f"tiempo {current['median']:.6f} s > presupuesto {limits['time']} s ({pattern})")
+            if "memory" in limits and current["peak_bytes"] > limits["memory"]:
+                row["problems"].append(f"memoria {current['peak_bytes']} B > presupuesto {limits['memory']} B ({pattern})")
+
+        row["over_budget"] = bool(row["problems"])
+        if base is None:
+            row["status"] = "presupuesto" if row["problems"] else "nuevo"
+            continue
+        noise = max(base["p95"] - base["median"], 0.0)
+        row["limit"] = base["median"] * (1 + tolerance) + max(noise_factor * noise, MIN_TIME_DELTA)
+        memory_limit = base["peak_bytes"] * (1 + MEMORY_TOLERANCE) + MIN_MEMORY_DELTA
+        regressions = []
+        if current["min"] > row["limit"]:
+            regressions.append(f"tiempo {current['min']:.6f} s (mínimo) > límite {row['limit']:.6f} s")
+        if current["peak_bytes"] > memory_limit:
+            regressions.append(f"memoria {current['peak_bytes']} B > límite {int(memory_limit)} B")
+
+        if regressions:
+            row["status"] = "regresión"
+        elif row["problems"]:
+            row["status"] = "presupuesto"
+        elif current["median"] < base["min"] * (1 - tolerance) - max(noise_factor * noise, MIN_TIME_DELTA):
+            row["status"] = "mejora"
+        else:
+            row["status"] = "ok"
+        row["problems"] = regressions + row["problems"]
+    return rows
+
+FAILING = {"regresión", "presupuesto"}
+
+# Función para descartar regresiones causadas por ruido
+def confirm_regressions(results, baseline, budgets=None, seed=0, tolerance=TOLERANCE, retries=RETRIES, processes=1,
+                        **timing_options):
+    """Compara con la base y vuelve a medir los casos en regresión hasta `retries` veces, conservando
+    la medición más rápida de cada uno (modifica `results`). Retorna las filas finales de compare."""
+    rows = compare(results, baseline, budgets, tolerance)
+    for _ in range(retries):
+        suspects = [row["case"] for row in rows if row["status"] == "regresión"]
+        if not suspects:
+            break
+        for case_id, again in run_suite_processes(seed, suspects, processes, False, **timing_options).items():
+            if again["min"] < results[case_id]["min"]:
+                results[case_id] = again
+        rows = compare(results, baseline, budgets, tolerance)
+    return rows
+
+# Función para escribir el reporte de diferencias
+def format_report(rows, baseline=None):
+    """Tabla con la base, la medición actual y el cambio de cada caso; los problemas se listan al final."""
+    lines = []
+    if baseline is None:
+        lines.append("Sin base de comparación: solo se revisan los presupuestos.")
+    else:
+        machine = baseline.get("machine", {})
+        lines.append(f"Base: revisión {baseline.get('revision')} en {machine.get('node')} (semilla {baseline.get('seed')})")
+        if machine != machine_info():
+            lines.append("Atención: la base se midió en otra máquina; las diferencias de tiempo no son comparables.")
+    lines.append(f"Actual: revisión {git_revision()}")
+    lines.append("")
+    lines.append(f"{'caso':<50}{'base (s)':>12}{'actual (s)':>12}{'cambio':>9}{'base (B)':>12}{'actual (B)':>12}  estado")
+    for row in rows:
+        base, current = row["base"], row["current"]
+        base_time = f"{base['median']:.6f}" if base else "-"
+        current_time = f"{current['median']:.6f}" if current else "-"
+        change = f"{(current['median'] / base['median'] - 1) * 100:+.1f}%" if base and current and base["median"] else "-"
+        base_memory = str(base["peak_bytes"]) if base else "-"
+        current_memory = str(current["peak_bytes"]) if current else "-"
+        lines.append(f"{row['case']:<50}{base_time:>12}{current_time:>12}{change:>9}{base_memory:>12}"
+                     f"{current_memory:>12}  {row['status']}")
+
+    failing = [row for row in rows if row["status"] in FAILING]
+    counts = {}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    lines.append("")
+    lines.append("Resumen: " + ", ".join(f"{status}: {count}" for status, count in sorted(counts.items())))
+    for row in failing:
+        for problem in row["problems"]:
+            lines.append(f"  {row['case']}: {problem}")
+    return "\n".join(lines) + "\n"
+
+# Ejecutar la suite: retorna 1 si hay regresiones o presupuestos excedidos y 2 si falta la base
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Suite de regresión de rendimiento de AnalisarArreglos y AnalisarMatrix.")
+    parser.add_argument("--actualizar-base", action="store_true", help="guardar esta ejecución como la nueva base")
+    parser.add_argument("--filtro", nargs="+", default=None, help="patrones de casos, p. ej. 'sort/*' 'matrix/exact/*'")
+    parser.add_argument("--base", default=BASELINE_FILE)
+    parser.add_argument("--presupuestos", default=BUDGETS_FILE)
+    parser.add_argument("--reporte", default=REPORT_FILE)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--procesos", type=int, default=3, help="procesos nuevos en los que se repite la suite")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCE, help="aumento relativo permitido sobre la base")
+    parser.add_argument("--solo-presupuestos", action="store_true",
+                        help="sin base, revisar solo los presupuestos en vez de terminar con código 2")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")  # Decisiones de auto_sort
+    baseline = load_baseline(args.base)
+    if baseline is not None and baseline.get("seed") != args.semilla:
+        print(f"La base usa la semilla {baseline.get('seed')}; se ignora para la semilla {args.semilla}.")
+        baseline = None
+    if baseline is None and not (args.actualizar_base or args.solo_presupuestos):
+        print(f"No hay base de comparación en {args.base}. Créela en la máquina de referencia con "
+              f"`python SuiteRendimiento.py --actualizar-base` (y versiónela), o use --solo-presupuestos.")
+        sys.exit(2)
+
+    results = run_suite_processes(args.semilla, args.filtro, args.procesos, repetitions=args.repeticiones)
+    rows = confirm_regressions(results, baseline, load_budgets(args.presupuestos), args.semilla, args.tolerancia,
+                               processes=args.procesos, repetitions=args.repeticiones)
+    if args.filtro:
+        rows = [row for row in rows if row["current"] is not None]  # Los casos filtrados no cuentan como "sin medir"
+    report = format_report(rows, baseline)
+    with open(args.reporte, 'w') as f:
+        f.write(report)
+    print(report, end="")
+
+    if args.actualizar_base:
+        cases = dict(baseline["cases"]) if baseline and args.filtro else {}
+        cases.update(results)
+        save_baseline(cases, args.semilla, args.base)
+        print(f"Base actualizada en {args.base}")
+        # Al fijar una base nueva solo los presupuestos pueden fallar
+        sys.exit(1 if any(row["over_budget"] for row in rows) else 0)
+    sys.exit(1 if any(row["status"] in FAILING for row in rows) else 0)
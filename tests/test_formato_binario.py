@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from FormatoBinario import convert_text_to_binary, open_binary
+
+CASES = [
+    (b"5 17 3 99 0 12\n\n", [5, 17, 3, 99, 0, 12]),
+    (b"5 17 3 \n", [5, 17, 3]),
+    (b"  -4 8\n\n\n-9223372036854775808 9223372036854775807\n", [[-4, 8], [-9223372036854775808, 9223372036854775807]]),
+    (b"1 2 3\r\n4 5 6\r\n7 8 9\r\n", [[1, 2, 3], [4, 5, 6], [7, 8, 9]]),
+    (b"10 20\n30 40\n\n", [[10, 20], [30, 40]]),
+    (b"\n\n", []),
+]
+
+@pytest.mark.parametrize("text, expected", CASES)
+@pytest.mark.parametrize("block_size", list(range(1, 17)) + [1 << 24])
+def test_text_to_binary_round_trip(tmp_path, text, expected, block_size):
+    text_path = tmp_path / "dataset.txt"
+    text_path.write_bytes(text)
+    bin_path = convert_text_to_binary(str(text_path), str(tmp_path / "dataset.bin"), block_size=block_size)
+    assert np.asarray(open_binary(bin_path)).tolist() == expected
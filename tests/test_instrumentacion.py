@@ -0,0 +1,32 @@
+import numpy as np
+
+from AnalisarArreglos import measure_sorting_time
+from AnalisarMatrix import measure_multiplication_time
+from Instrumentacion import INSTRUMENTED_SORTS, count_multiplication_operations, count_sorting_operations
+
+def test_sorting_counts_come_from_the_real_engine():
+    arr = np.random.default_rng(0).integers(0, 100, 60).astype(np.int8)
+    counters = count_sorting_operations("bubble_sort", arr)
+    assert counters["comparisons"] == 60 * 59 // 2
+    assert counters["ratio"] == 1.0
+    assert count_sorting_operations("merge_sort", arr)["max_depth"] == 6
+
+def test_instrumented_sort_keeps_the_engine_result():
+    arr = np.random.default_rng(1).integers(0, 100, 40).astype(np.int8)
+    for algorithm in INSTRUMENTED_SORTS:
+        result, stats = measure_sorting_time(algorithm, arr, instrument=True, repetitions=1, warmup=0)
+        assert list(result) == sorted(arr.tolist())
+        assert stats["operations"]["comparisons"] > 0
+
+def test_multiplication_counts_come_from_the_real_engine():
+    A = np.random.default_rng(2).integers(-5, 5, (8, 8)).tolist()
+    assert count_multiplication_operations("traditional", A, A)["multiplies"] == 8 ** 3
+    counters = count_multiplication_operations("strassen", A, A, threshold=2)
+    assert counters["multiplies"] == 7 ** 2 * 2 ** 3
+    assert sorted(counters["levels"]) == [0, 1, 2]
+
+def test_instrumented_multiplication_keeps_the_engine_result():
+    A = np.random.default_rng(3).integers(0, 100, (5, 5))
+    C, stats = measure_multiplication_time("strassen", A, A, instrument=True, repetitions=1, warmup=0)
+    assert np.array_equal(np.asarray(C), A @ A)
+    assert stats["operations"]["multiplies"] > 0
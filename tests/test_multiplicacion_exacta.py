@@ -0,0 +1,43 @@
+import numpy as np
+
+from AnalisarMatrix import blocked_multiplication, exact_multiplication, strassen_numpy, traditional_multiplication
+from CacheResultados import verify_product
+
+INT64_MIN = np.iinfo(np.int64).min
+INT64_MAX = np.iinfo(np.int64).max
+
+def test_exact_multiplication_int64_min():
+    A = np.array([[INT64_MIN, 5]], dtype=np.int64)
+    B = np.array([[3], [2]], dtype=np.int64)
+    C = exact_multiplication(A, B)
+    assert C.tolist() == [[-27670116110564327414]]
+    assert C.tolist() == traditional_multiplication(A.tolist(), B.tolist())
+
+def test_exact_multiplication_int64_extremes():
+    rng = np.random.default_rng(0)
+    A = rng.integers(INT64_MIN, INT64_MAX, (6, 7), endpoint=True)
+    B = rng.integers(INT64_MIN, INT64_MAX, (7, 5), endpoint=True)
+    A[0, 0] = B[0, 0] = INT64_MIN
+    A[1, 1] = B[1, 1] = INT64_MAX
+    assert exact_multiplication(A, B).tolist() == traditional_multiplication(A.tolist(), B.tolist())
+
+def test_numpy_engines_stay_exact_with_int64_min():
+    # La cota (>= 2^63) descarta float64 e int64: el resultado es el exacto, no el producto módulo 2^64
+    A = np.array([[INT64_MIN, 0], [0, 1]], dtype=np.int64)
+    B = np.array([[-1, 0], [0, 1]], dtype=np.int64)
+    expected = traditional_multiplication(A.tolist(), B.tolist())
+    assert strassen_numpy(A, B, threshold=1).tolist() == expected
+    assert blocked_multiplication(A, B, block_size=1).tolist() == expected
+
+def test_numpy_engines_do_not_wrap_large_products():
+    A = np.full((8, 8), 2 ** 31 - 1, dtype=np.int64)
+    expected = traditional_multiplication(A.tolist(), A.tolist())
+    assert expected[0][0] == 36893488113059364872
+    assert strassen_numpy(A, A, threshold=2).tolist() == expected
+    assert blocked_multiplication(A, A, block_size=2).tolist() == expected
+
+def test_verify_product_int64_min():
+    A = np.array([[INT64_MIN, 5]], dtype=np.int64)
+    B = np.array([[3], [2]], dtype=np.int64)
+    assert verify_product(A, B, exact_multiplication(A, B))
+    assert not verify_product(A, B, np.array([[INT64_MIN]], dtype=np.int64))
@@ -0,0 +1,89 @@
+import functools
+
+import numpy as np
+import pytest
+
+from AnalisarArreglos import _intro_sort, adaptive_merge_sort, counting_sort, intro_sort, sort_array
+
+INT64_MIN = int(np.iinfo(np.int64).min)
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+def _cases():
+    rng = np.random.default_rng(0)
+    random = rng.integers(-1000, 1000, 500).tolist()
+    return {
+        "empty": [],
+        "single": [7],
+        "random": random,
+        "sorted": sorted(random),
+        "reverse": sorted(random, reverse=True),
+        "all_equal": [42] * 300,
+        "few_keys": rng.integers(0, 3, 400).tolist(),
+        "runs": sorted(random[:250]) + sorted(random[250:], reverse=True),
+        "int64_extremes": [INT64_MAX, 0, INT64_MIN, -1, INT64_MAX, INT64_MIN, 1] * 20,
+    }
+
+CASES = _cases()
+
+def _sorted_in_place(engine, values):
+    data = list(values)
+    engine(data)
+    return data
+
+@pytest.mark.parametrize("name", CASES)
+def test_adaptive_merge_sort(name):
+    assert _sorted_in_place(adaptive_merge_sort, CASES[name]) == sorted(CASES[name])
+
+@pytest.mark.parametrize("name", CASES)
+def test_adaptive_merge_sort_on_typed_buffer(name):
+    arr = np.array(CASES[name], dtype=np.int64)
+    assert sort_array("adaptive_merge_sort", arr).tolist() == sorted(CASES[name])
+
+@functools.total_ordering
+class _Keyed:
+    """Elemento que se compara solo por `key`; `tag` permite verificar la estabilidad."""
+
+    def __init__(self, key, tag):
+        self.key, self.tag = key, tag
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+@pytest.mark.parametrize("name", ["random", "sorted", "reverse", "all_equal", "few_keys", "runs"])
+def test_adaptive_merge_sort_is_stable(name):
+    items = [_Keyed(key % 7, tag) for tag, key in enumerate(CASES[name])]
+    result = _sorted_in_place(adaptive_merge_sort, items)
+    expected = sorted(items, key=lambda item: item.key)  # sorted es estable
+    assert [(item.key, item.tag) for item in result] == [(item.key, item.tag) for item in expected]
+
+@pytest.mark.parametrize("name", CASES)
+def test_intro_sort(name):
+    assert _sorted_in_place(intro_sort, CASES[name]) == sorted(CASES[name])
+
+@pytest.mark.parametrize("name", CASES)
+def test_intro_sort_on_typed_buffer(name):
+    arr = np.array(CASES[name], dtype=np.int64)
+    assert sort_array("intro_sort", arr).tolist() == sorted(CASES[name])
+
+def test_intro_sort_falls_back_to_heapsort():
+    # Sin presupuesto de profundidad toda partición grande pasa a heapsort
+    values = CASES["random"]
+    data = list(values)
+    _intro_sort(data, 0, len(data) - 1, 0, 16)
+    assert data == sorted(values)
+
+@pytest.mark.parametrize("name", CASES)
+@pytest.mark.parametrize("max_range", [1 << 20, 1])  # max_range=1 obliga al radix LSD
+def test_counting_sort(name, max_range):
+    result = counting_sort(list(CASES[name]), max_range=max_range)
+    assert isinstance(result, list)
+    assert result == sorted(CASES[name])
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.int64])
+def test_counting_sort_on_typed_buffer(dtype):
+    info = np.iinfo(dtype)
+    arr = np.random.default_rng(1).integers(info.min, info.max, 1000, endpoint=True).astype(dtype)
+    assert np.array_equal(sort_array("counting_sort", arr.copy()), np.sort(arr))
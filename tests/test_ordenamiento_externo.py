@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from FormatoBinario import load_array, write_binary
+from OrdenamientoExterno import BYTES_PER_ELEMENT, external_sort
+
+INT64_MIN = np.iinfo(np.int64).min
+INT64_MAX = np.iinfo(np.int64).max
+
+def _dataset(tmp_path, values):
+    path = tmp_path / "entrada.bin"
+    write_binary(np.asarray(values, dtype=np.int64), str(path))
+    return str(path)
+
+def _inputs():
+    rng = np.random.default_rng(0)
+    random = rng.integers(-1000, 1000, 1000)
+    extremes = rng.integers(INT64_MIN, INT64_MAX, 500, endpoint=True)
+    extremes[::50] = INT64_MIN
+    extremes[1::50] = INT64_MAX
+    return {"random": random, "reverse": np.sort(random)[::-1], "all_equal": np.full(700, 5),
+            "int64_extremes": extremes, "empty": np.empty(0, dtype=np.int64)}
+
+INPUTS = _inputs()
+
+@pytest.mark.parametrize("name", INPUTS)
+@pytest.mark.parametrize("algorithm", ["sorted_builtin", "merge_sort", "intro_sort"])
+def test_external_sort_with_multi_pass_merge(tmp_path, name, algorithm):
+    # 50 elementos por corrida y fan-in 2: 1000 elementos dan 20 corridas y varias pasadas de mezcla
+    values = INPUTS[name]
+    output = str(tmp_path / "salida.bin")
+    info = external_sort(_dataset(tmp_path, values), output, algorithm, memory_budget=50 * BYTES_PER_ELEMENT,
+                         temp_dir=str(tmp_path))
+    assert np.asarray(load_array(output)).tolist() == sorted(values.tolist())
+    if len(values) > 200:
+        assert info["merge_passes"] > 2
+    # Las corridas temporales se borran
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["entrada.bin", "salida.bin"]
+
+def test_external_sort_text_output(tmp_path):
+    values = INPUTS["random"]
+    output = tmp_path / "salida.txt"
+    info = external_sort(_dataset(tmp_path, values), str(output), memory_budget=100 * BYTES_PER_ELEMENT)
+    assert info["chunks"] == 10
+    assert [int(v) for v in output.read_text().split()] == sorted(values.tolist())
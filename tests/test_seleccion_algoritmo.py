@@ -0,0 +1,24 @@
+import logging
+
+import numpy as np
+
+from AnalisarArreglos import measure_sorting_time
+from SeleccionAlgoritmo import choose_algorithm, dispatch_decision
+
+def test_auto_sort_records_its_decision(caplog):
+    arr = np.random.default_rng(0).integers(0, 100, 200).tolist()
+    with caplog.at_level(logging.INFO, logger="SeleccionAlgoritmo"):
+        result, stats = measure_sorting_time("auto_sort", arr, repetitions=3, warmup=0)
+    assert list(result) == sorted(arr)
+    decision = stats["dispatch"]
+    assert decision["algorithm"] == choose_algorithm(arr) == "counting_sort"
+    assert decision["features"]["span"] <= 100
+    # Una línea de INFO por medición, no una por repetición
+    assert [r.getMessage() for r in caplog.records if r.levelno == logging.INFO] == [
+        f"auto_sort: n=200 rango={decision['features']['span']} run_ratio={decision['features']['run_ratio']:.3f} "
+        f"inversion_ratio={decision['features']['inversion_ratio']:.3f} -> counting_sort ({decision['reason']})"]
+
+def test_small_arrays_are_dispatched_without_sampling():
+    decision = dispatch_decision([3, 1, 2])
+    assert decision["algorithm"] == "insertion_sort"
+    assert decision["features"] is None